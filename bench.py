@@ -0,0 +1,277 @@
+import sys
+import os
+import gc
+import json
+import time
+import random
+import argparse
+import platform
+import tempfile
+import tracemalloc
+from array import array
+
+from solvers import Maze, Components, SOLVERS, solve, parse_input_file, load_numpy
+from mazefile import write_text
+
+# Mide parseo, resolucion (rapida y con historial) y reproduccion sin dibujo
+# sobre laberintos sinteticos con semilla fija. Cada fase se cronometra
+# (--repeat veces, quedando la mejor) y, salvo --no-memory, se corre otra vez
+# bajo tracemalloc para el pico de memoria (tracemalloc hace mas lento el
+# codigo, por eso no se mezclan).
+# El resultado se escribe en JSON; --compare marca las fases que se pusieron
+# mas lentas que en un JSON anterior.
+
+DEFAULT_SIZES = (10, 100, 1000)
+MAX_JUMP = 4
+ZERO_SHARE = 0.4
+HISTORY_MAX_CELLS = 4_000_000
+PLAYBACK_FRAMES = 2000
+# Caso fijo para los solvers de profundizacion: un tablero sin solucion obliga
+# a agotar todas las iteraciones, que es donde se nota si se re-expande.
+DEEPENING_ALGOS = ("IDDFS", "IDASTAR")
+DEEPENING_SIZE = 150
+
+
+def generate_random(m, n, rng, max_jump=MAX_JUMP):
+    cells = array('B', rng.choices(range(1, max_jump + 1), k=m * n))
+    cells[-1] = 0
+    return Maze(m, n, (0, 0), (m - 1, n - 1), cells)
+
+
+def generate_serpentine(m, n, rng, max_jump=MAX_JUMP):
+    # Filas pares de unos unidas por un conector que alterna de extremo en las
+    # filas impares (el resto son ceros, callejones sin salida): el unico
+    # camino recorre toda la serpiente.
+    cells = array('B', [1]) * (m * n)
+    for r in range(1, m, 2):
+        cells[r * n:(r + 1) * n] = array('B', [0]) * n
+        cells[r * n + (n - 1 if r // 2 % 2 == 0 else 0)] = 1
+    last = m - 1 if m % 2 else m - 2
+    goal = (last, n - 1 if last // 2 % 2 == 0 else 0)
+    cells[goal[0] * n + goal[1]] = 0
+    return Maze(m, n, (0, 0), goal, cells)
+
+
+def generate_unsolvable(m, n, rng, max_jump=MAX_JUMP):
+    # Aleatorio, pero ninguna celda de la fila o columna de la meta salta
+    # exactamente la distancia que la separa de ella.
+    maze = generate_random(m, n, rng, max_jump)
+    goal_r, goal_c = maze.goal_pos
+    cells = maze.cells
+    line = [(goal_r, c) for c in range(n)] + [(r, goal_c) for r in range(m)]
+    for r, c in line:
+        distance = abs(r - goal_r) + abs(c - goal_c)
+        if distance and cells[r * n + c] == distance:
+            cells[r * n + c] = distance % max_jump + 1 if max_jump > 1 else 0
+    return maze
+
+
+def generate_zeros(m, n, rng, max_jump=MAX_JUMP):
+    weights = [ZERO_SHARE] + [(1 - ZERO_SHARE) / max_jump] * max_jump
+    cells = array('B', rng.choices(range(max_jump + 1), weights, k=m * n))
+    cells[0] = max(cells[0], 1)
+    return Maze(m, n, (0, 0), (m - 1, n - 1), cells)
+
+
+GENERATORS = {
+    "random": generate_random,
+    "serpentine": generate_serpentine,
+    "unsolvable": generate_unsolvable,
+    "zeros": generate_zeros,
+}
+
+
+def measure(fn, memory=True, repeat=1):
+    best = None
+    for _ in range(repeat):
+        gc.collect()
+        start = time.perf_counter()
+        info = fn() or {}
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    result = {"wall_s": best}
+    result.update(info)
+    if memory:
+        del info
+        gc.collect()
+        tracemalloc.start()
+        try:
+            fn()
+            result["peak_bytes"] = tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+    return result
+
+
+def _moves(path):
+    return len(path) - 1 if path else None
+
+
+def _fresh(maze):
+    # Mismo tablero y misma adyacencia, sin componentes ni otras caches: asi
+    # las fases solve/history miden la busqueda y no una consulta ya resuelta.
+    fresh = Maze(maze.m, maze.n, maze.start_pos, maze.goal_pos, memoryview(maze.cells))
+    fresh._adjacency = maze.adjacency()
+    return fresh
+
+
+def run_solve(maze, algo):
+    moves, _ = solve(maze, algo)
+    return {"moves": moves}
+
+
+def run_history(maze, algo, keep):
+    solver = SOLVERS[algo](maze)
+    solver.run_all()
+    keep[:] = [solver]
+    return {"moves": _moves(solver.solution_path), "expanded": solver.expanded, "steps": len(solver.history)}
+
+
+def run_playback(history, frames):
+    # Lo que hace la vista por cuadro, sin dibujar: mover el cursor y pedir
+    # las celdas que cambiaron. Avanza de a saltos fijos, vuelve al inicio y
+    # salta al final.
+    last = len(history) - 1
+    stride = max(1, -(-last // frames))
+    history.seek(0)
+    index = 0
+    dirty = 0
+    while index < last:
+        nxt = min(index + stride, last)
+        history.seek(nxt)
+        dirty += len(history.changed_cells(index, nxt))
+        index = nxt
+    history.seek(0)
+    history.seek(last)
+    return {"frames": -(-last // stride) + 2, "dirty_cells": dirty}
+
+
+def bench_case(name, size, algos, seed, memory, repeat, history_max_cells, playback_frames):
+    rng = random.Random(f"{seed}:{name}:{size}")
+    start = time.perf_counter()
+    maze = GENERATORS[name](size, size, rng)
+    generate_s = time.perf_counter() - start
+    base = {"generator": name, "m": maze.m, "n": maze.n}
+    rows = [dict(base, phase="generate", wall_s=generate_s)]
+
+    with tempfile.TemporaryDirectory() as tmp:
+        text = os.path.join(tmp, "maze.txt")
+        write_text(text, [maze])
+        rows.append(dict(base, phase="parse", **measure(lambda: {"mazes": len(parse_input_file(text))}, memory, repeat)))
+
+    rows.append(dict(base, phase="adjacency", **measure(lambda: {"edges": len(maze._build_adjacency().targets)}, memory, repeat)))
+    maze.adjacency()
+    rows.append(dict(base, phase="components", **measure(lambda: {"components": len(Components(maze.adjacency()))}, memory, repeat)))
+
+    for algo in algos:
+        rows.append(dict(base, phase="solve", algo=algo, **measure(lambda: run_solve(_fresh(maze), algo), memory, repeat)))
+        if maze.m * maze.n > history_max_cells:
+            rows.append(dict(base, phase="history", algo=algo, skipped=True))
+            continue
+        keep = []
+        rows.append(dict(base, phase="history", algo=algo, **measure(lambda keep=keep: run_history(_fresh(maze), algo, keep), memory, repeat)))
+        history = keep[0].history
+        rows.append(dict(base, phase="playback", algo=algo,
+                         **measure(lambda history=history: run_playback(history, playback_frames), memory, repeat)))
+        del keep, history
+    return rows
+
+
+def _key(row):
+    return (row["generator"], row["m"], row["n"], row["phase"], row.get("algo"))
+
+
+def compare(rows, baseline_file, tolerance):
+    with open(baseline_file) as f:
+        baseline = {_key(row): row for row in json.load(f)["results"]}
+    regressions = []
+    for row in rows:
+        old = baseline.get(_key(row))
+        if not old or "wall_s" not in row or "wall_s" not in old or row["phase"] == "generate":
+            continue
+        if row["wall_s"] > old["wall_s"] * (1 + tolerance):
+            regressions.append((row, old))
+    return regressions
+
+
+def _describe(row):
+    algo = f" {row['algo']}" if row.get("algo") else ""
+    return f"{row['generator']:<11}{row['m']}x{row['n']:<6}{row['phase']:<11}{algo:<7}"
+
+
+def _print_row(row):
+    if row.get("skipped"):
+        print(f"{_describe(row)}  (omitido)")
+        return
+    line = f"{_describe(row)}{row['wall_s'] * 1000:>12.2f} ms"
+    if "peak_bytes" in row:
+        line += f"{row['peak_bytes'] / 2**20:>10.1f} MiB"
+    extras = [f"{key}={row[key]}" for key in ("moves", "expanded", "steps", "frames", "components") if key in row]
+    print(line + "  " + " ".join(extras))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmarks de parseo, solvers y reproduccion")
+    parser.add_argument("--sizes", default=",".join(map(str, DEFAULT_SIZES)),
+                        help="lados de los laberintos cuadrados, p. ej. 10,100,1000,4000")
+    parser.add_argument("--generators", default=",".join(GENERATORS))
+    parser.add_argument("--algos", default="DFS,UCS")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--repeat", type=int, default=1, help="corridas cronometradas por fase (se guarda la mejor)")
+    parser.add_argument("--no-memory", action="store_true", help="no medir el pico con tracemalloc")
+    parser.add_argument("--history-max-cells", type=int, default=HISTORY_MAX_CELLS,
+                        help="sobre este tamano se omiten el historial y la reproduccion")
+    parser.add_argument("--playback-frames", type=int, default=PLAYBACK_FRAMES)
+    parser.add_argument("--deepening-size", type=int, default=DEEPENING_SIZE,
+                        help="lado del tablero sin solucion para IDDFS/IDASTAR (0 = no correrlo)")
+    parser.add_argument("-o", "--output", default="bench.json")
+    parser.add_argument("--label", default="", help="etiqueta guardada en el JSON (version, rama...)")
+    parser.add_argument("--compare", metavar="JSON", help="JSON anterior contra el cual comparar")
+    parser.add_argument("--tolerance", type=float, default=0.2, help="lentitud relativa aceptada en --compare")
+    args = parser.parse_args(argv)
+
+    sizes = [int(size) for size in args.sizes.split(",")]
+    generators = args.generators.split(",")
+    algos = args.algos.split(",")
+    for name in generators:
+        if name not in GENERATORS:
+            parser.error(f"generador desconocido: {name}")
+    for algo in algos:
+        if algo not in SOLVERS:
+            parser.error(f"algoritmo desconocido: {algo}")
+
+    cases = [(name, size, algos) for size in sizes for name in generators]
+    if args.deepening_size > 0:
+        cases.append(("unsolvable", args.deepening_size, DEEPENING_ALGOS))
+    rows = []
+    for name, size, case_algos in cases:
+        for row in bench_case(name, size, case_algos, args.seed, not args.no_memory, max(1, args.repeat),
+                              args.history_max_cells, args.playback_frames):
+            _print_row(row)
+            rows.append(row)
+
+    numpy = load_numpy()
+    report = {
+        "label": args.label,
+        "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "numpy": numpy.__version__ if numpy is not None else None,
+        "seed": args.seed,
+        "repeat": args.repeat,
+        "results": rows,
+    }
+    with open(args.output, "w") as f:
+        json.dump(report, f, indent=1)
+    print(f"Resultados escritos en {args.output}")
+
+    if args.compare:
+        regressions = compare(rows, args.compare, args.tolerance)
+        for row, old in regressions:
+            print(f"MAS LENTO {_describe(row)}{old['wall_s'] * 1000:.2f} ms -> {row['wall_s'] * 1000:.2f} ms")
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,173 @@
+import sys
+import os
+import mmap
+import struct
+import argparse
+import tempfile
+from array import array
+
+from solvers import Maze, iter_mazes, _typecode
+
+# Formato binario de laberintos (little-endian):
+#
+#   cabecera   MAGIC, version (u16), reservado (u16), cantidad (u32),
+#              offset de la tabla (u64)
+#   datos      la grilla de cada laberinto como arreglo plano, alineada a 8 bytes
+#   tabla      por laberinto: m, n, inicio, meta (6 x i32), typecode, offset (u64)
+#
+# La tabla va al final para poder escribir el archivo en una sola pasada
+# mientras se lee el texto. MazeFile abre el archivo con mmap y entrega cada
+# laberinto sin copiar su grilla (Maze.cells es un memoryview sobre el mmap).
+
+MAGIC = b"LABS"
+VERSION = 1
+HEADER = struct.Struct("<4sHHIQ")
+ENTRY = struct.Struct("<6ic3xQ")
+ITEM_SIZES = {"B": 1, "b": 1, "H": 2, "h": 2, "I": 4, "i": 4, "Q": 8, "q": 8}
+
+
+def is_binary(filename):
+    with open(filename, "rb") as f:
+        return f.read(len(MAGIC)) == MAGIC
+
+
+def write_binary(filename, mazes):
+    entries = []
+    with open(filename, "wb") as f:
+        f.write(HEADER.pack(MAGIC, VERSION, 0, 0, 0))
+        for maze in mazes:
+            typecode = _typecode(maze.cells)
+            cells = maze.cells if isinstance(maze.cells, array) else array(typecode, maze.cells)
+            if cells.itemsize != ITEM_SIZES[typecode] or sys.byteorder != "little":
+                cells = array(typecode, cells)
+                if sys.byteorder != "little":
+                    cells.byteswap()
+            f.write(b"\0" * (-f.tell() % 8))
+            entries.append((maze, typecode, f.tell()))
+            cells.tofile(f)
+
+        f.write(b"\0" * (-f.tell() % 8))
+        table_offset = f.tell()
+        for maze, typecode, offset in entries:
+            f.write(ENTRY.pack(maze.m, maze.n, *maze.start_pos, *maze.goal_pos, typecode.encode(), offset))
+        f.seek(0)
+        f.write(HEADER.pack(MAGIC, VERSION, 0, len(entries), table_offset))
+    return len(entries)
+
+
+def write_text(filename, mazes):
+    with open(filename, "w") as f:
+        return write_text_to(f, mazes)
+
+
+def write_text_to(f, mazes):
+    count = 0
+    for maze in mazes:
+        f.write(f"{maze.m} {maze.n} {maze.start_pos[0]} {maze.start_pos[1]} {maze.goal_pos[0]} {maze.goal_pos[1]}\n")
+        for row in maze.grid:
+            f.write(" ".join(map(str, row)))
+            f.write("\n")
+        count += 1
+    f.write("0\n")
+    return count
+
+
+class MazeFile:
+    def __init__(self, filename):
+        self._file = open(filename, "rb")
+        try:
+            self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            self._file.close()
+            raise ValueError(f"Archivo binario vacio: {filename}")
+        magic, version, _, count, table_offset = HEADER.unpack_from(self._mmap, 0)
+        if magic != MAGIC or version != VERSION:
+            self.close()
+            raise ValueError(f"No es un archivo de laberintos binario: {filename}")
+        self._entries = [ENTRY.unpack_from(self._mmap, table_offset + k * ENTRY.size) for k in range(count)]
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __getitem__(self, k):
+        m, n, start_r, start_c, goal_r, goal_c, typecode, offset = self._entries[k]
+        typecode = typecode.decode()
+        size = m * n * ITEM_SIZES[typecode]
+        cells = memoryview(self._mmap)[offset:offset + size]
+        if sys.byteorder == "little" and array(typecode).itemsize == ITEM_SIZES[typecode]:
+            cells = cells.cast(typecode)
+        else:
+            cells = array(typecode, cells.tobytes())
+            if sys.byteorder != "little":
+                cells.byteswap()
+        return Maze(m, n, (start_r, start_c), (goal_r, goal_c), cells)
+
+    def __iter__(self):
+        for k in range(len(self)):
+            yield self[k]
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        try:
+            self._mmap.close()
+        except BufferError:
+            # Aun hay laberintos vivos apuntando al mmap; se libera con ellos.
+            pass
+        self._file.close()
+
+
+def _same_maze(a, b):
+    return (a.m, a.n, a.start_pos, a.goal_pos) == (b.m, b.n, b.start_pos, b.goal_pos) and \
+        list(a.cells) == list(b.cells)
+
+
+def check_round_trip(filename):
+    mazes = list(iter_mazes(filename))
+    with tempfile.TemporaryDirectory() as tmp:
+        binary = os.path.join(tmp, "mazes.lab")
+        text = os.path.join(tmp, "mazes.txt")
+        write_binary(binary, mazes)
+        with MazeFile(binary) as maze_file:
+            write_text(text, maze_file)
+            from_binary = list(maze_file)
+            ok = len(from_binary) == len(mazes) and all(map(_same_maze, mazes, from_binary))
+            del from_binary
+        from_text = list(iter_mazes(text))
+        ok = ok and len(from_text) == len(mazes) and all(map(_same_maze, mazes, from_text))
+    return ok, len(mazes)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Conversor de laberintos entre texto y binario")
+    commands = parser.add_subparsers(dest="command", required=True)
+    to_bin = commands.add_parser("to-bin", help="texto -> binario")
+    to_bin.add_argument("source")
+    to_bin.add_argument("target")
+    to_text = commands.add_parser("to-text", help="binario -> texto")
+    to_text.add_argument("source")
+    to_text.add_argument("target")
+    check = commands.add_parser("check", help="verifica texto -> binario -> texto")
+    check.add_argument("source", nargs="?", default="input.txt")
+    args = parser.parse_args(argv)
+
+    if args.command == "to-bin":
+        count = write_binary(args.target, iter_mazes(args.source))
+        print(f"{count} laberintos escritos en {args.target}")
+    elif args.command == "to-text":
+        with MazeFile(args.source) as maze_file:
+            count = write_text(args.target, maze_file)
+        print(f"{count} laberintos escritos en {args.target}")
+    else:
+        ok, count = check_round_trip(args.source)
+        print(f"Ida y vuelta de {count} laberintos: {'OK' if ok else 'ERROR'}")
+        return 0 if ok else 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,375 @@
+import sys
+import os
+import io
+import json
+import time
+import signal
+import asyncio
+import argparse
+from concurrent.futures import ProcessPoolExecutor
+
+from solvers import SOLVERS, ResultCache, RESULT_STORE_MAX_ENTRIES, iter_mazes, read_mazes, _solve_chunk, _plan_chunks
+from mazefile import write_text_to
+
+# Servidor sin interfaz para resolver laberintos desde otros procesos.
+#
+# Cada pedido es texto en el formato de input.txt, terminado por la linea "0"
+# (o por el cierre de la conexion), y cada respuesta una linea JSON con los
+# movimientos y el camino por algoritmo, los avisos del parseo ("warnings":
+# laberintos invalidos que se saltaron) y los tiempos del pedido. Una
+# conexion puede mandar varios pedidos seguidos; las respuestas salen en el
+# mismo orden.
+#
+# Los laberintos de pedidos concurrentes se juntan durante --batch-delay-ms en
+# un lote: los repetidos o ya resueltos salen de la cache y el resto se
+# reparte en chunks entre procesos. Con --max-inflight pedidos en curso el
+# servidor deja de leer los sockets, y cada conexion deja de leer con
+# PIPELINE respuestas pendientes, asi la presion llega hasta el cliente.
+
+DEFAULT_PORT = 8765
+BATCH_DELAY_MS = 5
+MAX_BATCH = 1024
+MAX_INFLIGHT = 64
+MAX_REQUEST_CELLS = 16_000_000
+MAX_LINE_BYTES = 64 * 2**20
+PIPELINE = 8
+
+
+async def read_request(reader, max_cells=MAX_REQUEST_CELLS):
+    # Sigue las cabeceras para no confundir la fila "0" de un laberinto de una
+    # columna con el final del pedido. Lo invalido lo reporta read_mazes en
+    # los avisos de la respuesta.
+    lines = []
+    cells = 0
+    while True:
+        line = await reader.readline()
+        if not line:
+            return "".join(lines) if lines else None
+        line = line.decode()
+        lines.append(line)
+        try:
+            header = list(map(int, line.split()))
+        except ValueError:
+            continue
+        if not header or header == [0]:
+            return "".join(lines)
+        if len(header) != 6 or header[0] <= 0 or header[1] <= 0:
+            continue
+        cells += header[0] * header[1]
+        if cells > max_cells:
+            raise ValueError(f"El pedido supera el maximo de {max_cells} celdas")
+        for _ in range(header[0]):
+            line = await reader.readline()
+            if not line:
+                break
+            lines.append(line.decode())
+
+
+def _percentile(values, q):
+    return values[min(len(values) - 1, int(q * len(values)))]
+
+
+def _ms(seconds):
+    return round(seconds * 1000, 3)
+
+
+class SolveServer:
+    def __init__(self, workers=None, algos=("DFS", "UCS"), cache=None, chunk_size=64,
+                 batch_delay_ms=BATCH_DELAY_MS, max_batch=MAX_BATCH, max_inflight=MAX_INFLIGHT,
+                 max_cells=MAX_REQUEST_CELLS):
+        self.workers = workers or os.cpu_count() or 1
+        self.algos = tuple(algos)
+        self.cache = cache
+        self.chunk_size = chunk_size
+        self.batch_delay = batch_delay_ms / 1000
+        self.max_batch = max_batch
+        self.max_inflight = max_inflight
+        self.max_cells = max_cells
+        self.requests = 0
+        self.batches = 0
+        self._queue = None
+        self._inflight = None
+        self._pool = None
+        self._batcher_task = None
+
+    async def start(self, host="127.0.0.1", port=DEFAULT_PORT, path=None):
+        self._queue = asyncio.Queue()
+        self._inflight = asyncio.Semaphore(self.max_inflight)
+        self._pool = ProcessPoolExecutor(max_workers=self.workers)
+        self._batcher_task = asyncio.create_task(self._batcher())
+        if path:
+            return await asyncio.start_unix_server(self._handle, path, limit=MAX_LINE_BYTES)
+        return await asyncio.start_server(self._handle, host, port, limit=MAX_LINE_BYTES)
+
+    async def close(self):
+        if self._batcher_task is not None:
+            self._batcher_task.cancel()
+            self._batcher_task = None
+        if self._pool is not None:
+            self._pool.shutdown(cancel_futures=True)
+            self._pool = None
+
+    async def serve(self, host="127.0.0.1", port=DEFAULT_PORT, path=None):
+        server = await self.start(host, port, path)
+        try:
+            asyncio.get_running_loop().add_signal_handler(signal.SIGTERM, asyncio.current_task().cancel)
+        except NotImplementedError:
+            pass
+        try:
+            async with server:
+                where = path or ", ".join(f"{sock.getsockname()[0]}:{sock.getsockname()[1]}" for sock in server.sockets)
+                print(f"Servidor escuchando en {where} ({self.workers} procesos, {','.join(self.algos)})")
+                await server.serve_forever()
+        finally:
+            await self.close()
+
+    async def _handle(self, reader, writer):
+        replies = asyncio.Queue(PIPELINE)
+        sender = asyncio.create_task(self._send(replies, writer))
+        try:
+            while True:
+                try:
+                    request = await read_request(reader, self.max_cells)
+                except ValueError as e:
+                    # Sin saber donde termina el pedido no se puede seguir leyendo.
+                    await replies.put({"error": str(e)})
+                    break
+                if request is None:
+                    break
+                received = time.perf_counter()
+                await self._inflight.acquire()
+                await replies.put(asyncio.create_task(self._answer(request, received)))
+        except ConnectionError:
+            pass
+        finally:
+            await replies.put(None)
+            await sender
+            writer.close()
+
+    async def _send(self, replies, writer):
+        # Con la conexion caida se siguen esperando los pedidos en curso para
+        # liberar sus lugares, pero ya no se escribe.
+        broken = False
+        while True:
+            reply = await replies.get()
+            if reply is None:
+                return
+            if not isinstance(reply, dict):
+                reply = await reply
+            if broken:
+                continue
+            try:
+                writer.write(json.dumps(reply, separators=(",", ":")).encode() + b"\n")
+                await writer.drain()
+            except ConnectionError:
+                broken = True
+
+    async def _answer(self, text, received):
+        warnings = []
+        try:
+            start = time.perf_counter()
+            mazes = list(read_mazes(io.StringIO(text), warnings.append))
+            parsed = time.perf_counter()
+            if not mazes:
+                return {"error": "No se cargo laberinto.", "warnings": warnings}
+            loop = asyncio.get_running_loop()
+            futures = [loop.create_future() for _ in mazes]
+            for maze, future in zip(mazes, futures):
+                self._queue.put_nowait((maze, future))
+            results = await asyncio.gather(*futures)
+            solved = time.perf_counter()
+            reply = {"mazes": [self._describe(maze, *result) for maze, result in zip(mazes, results)],
+                     "warnings": warnings}
+            self.requests += 1
+            reply["time_ms"] = {"parse": _ms(parsed - start), "solve": _ms(solved - parsed),
+                                "total": _ms(time.perf_counter() - received)}
+            return reply
+        except Exception as e:
+            return {"error": f"{type(e).__name__}: {e}", "warnings": warnings}
+        finally:
+            self._inflight.release()
+
+    def _describe(self, maze, solved, cached):
+        entry = {"m": maze.m, "n": maze.n, "cached": cached}
+        for algo, (moves, path) in zip(self.algos, solved):
+            entry[algo] = {"moves": moves, "path": [list(pos) for pos in path] if path else None}
+        return entry
+
+    async def _batcher(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self._queue.get()]
+            deadline = loop.time() + self.batch_delay
+            while len(batch) < self.max_batch:
+                if not self._queue.empty():
+                    batch.append(self._queue.get_nowait())
+                    continue
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+            self.batches += 1
+            self._dispatch(batch)
+
+    def _dispatch(self, batch):
+        waiting = {}
+        todo = []
+        for maze, future in batch:
+            key = ResultCache.key(maze) if self.cache is not None else id(future)
+            if key in waiting:
+                waiting[key].append(future)
+                continue
+            waiting[key] = [future]
+            solved = self._cached(maze)
+            if solved is not None:
+                self._resolve(waiting.pop(key), solved, True)
+            else:
+                todo.append((key, maze))
+        mazes = [maze for _, maze in todo]
+        loop = asyncio.get_running_loop()
+        for chunk in _plan_chunks(mazes, range(len(mazes)), self.workers, self.chunk_size):
+            work = loop.run_in_executor(self._pool, _solve_chunk, chunk, self.algos)
+            work.add_done_callback(lambda done, chunk=chunk: self._solved(done, chunk, todo, waiting))
+
+    def _cached(self, maze):
+        if self.cache is None:
+            return None
+        solved = []
+        for algo in self.algos:
+            result = self.cache.get(maze, algo)
+            if result is None:
+                return None
+            solved.append(result)
+        return solved
+
+    def _solved(self, done, chunk, todo, waiting):
+        try:
+            results = done.result()
+        except Exception as e:
+            for index, _ in chunk:
+                for future in waiting.pop(todo[index][0]):
+                    if not future.done():
+                        future.set_exception(e)
+            return
+        for index, solved in results:
+            key, maze = todo[index]
+            if self.cache is not None:
+                for algo, (moves, cells) in zip(self.algos, solved):
+                    self.cache.put_cells(maze, algo, moves, cells)
+            solved = [(moves, [maze.cell_pos(cell) for cell in cells] if cells is not None else None)
+                      for moves, cells in solved]
+            self._resolve(waiting.pop(key), solved, False)
+
+    @staticmethod
+    def _resolve(futures, solved, cached):
+        # El primero de un grupo de repetidos es el que se resolvio; los demas
+        # reutilizan su resultado.
+        for k, future in enumerate(futures):
+            if not future.done():
+                future.set_result((solved, cached or k > 0))
+
+
+async def load_test(payload, connections, requests, host="127.0.0.1", port=DEFAULT_PORT, path=None):
+    # Cada conexion manda sus pedidos de a uno, esperando la respuesta.
+    latencies = []
+    errors = 0
+
+    async def client():
+        nonlocal errors
+        if path:
+            reader, writer = await asyncio.open_unix_connection(path, limit=MAX_LINE_BYTES)
+        else:
+            reader, writer = await asyncio.open_connection(host, port, limit=MAX_LINE_BYTES)
+        try:
+            for _ in range(requests):
+                start = time.perf_counter()
+                writer.write(payload)
+                await writer.drain()
+                line = await reader.readline()
+                if not line:
+                    raise ConnectionError("El servidor cerro la conexion")
+                latencies.append(time.perf_counter() - start)
+                if "error" in json.loads(line):
+                    errors += 1
+        finally:
+            writer.close()
+            await writer.wait_closed()
+
+    start = time.perf_counter()
+    await asyncio.gather(*(client() for _ in range(connections)))
+    return sorted(latencies), errors, time.perf_counter() - start
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Servidor de resolucion de laberintos y cliente de carga")
+    commands = parser.add_subparsers(dest="command", required=True)
+    serve = commands.add_parser("serve", help="atiende pedidos por TCP o socket Unix")
+    load = commands.add_parser("load", help="prueba de carga contra un servidor local")
+    for command in (serve, load):
+        command.add_argument("--host", default="127.0.0.1")
+        command.add_argument("--port", type=int, default=DEFAULT_PORT)
+        command.add_argument("--unix", metavar="RUTA", help="usa un socket Unix en lugar de TCP")
+    serve.add_argument("--workers", type=int, default=0, help="procesos para resolver (0 = uno por CPU)")
+    serve.add_argument("--algos", default="DFS,UCS")
+    serve.add_argument("--chunk-size", type=int, default=64, help="maximo de laberintos por tarea")
+    serve.add_argument("--batch-delay-ms", type=float, default=BATCH_DELAY_MS,
+                       help="espera para juntar pedidos concurrentes en un lote")
+    serve.add_argument("--max-batch", type=int, default=MAX_BATCH, help="maximo de laberintos por lote")
+    serve.add_argument("--max-inflight", type=int, default=MAX_INFLIGHT,
+                       help="pedidos en curso antes de dejar de leer los sockets")
+    serve.add_argument("--max-cells", type=int, default=MAX_REQUEST_CELLS, help="maximo de celdas por pedido")
+    serve.add_argument("--cache-file", metavar="ARCHIVO",
+                       help="guarda los resultados en una base sqlite para reutilizarlos entre ejecuciones")
+    serve.add_argument("--cache-max-entries", type=int, default=RESULT_STORE_MAX_ENTRIES,
+                       help="maximo de resultados guardados en --cache-file")
+    serve.add_argument("--no-cache", action="store_true", help="no reutiliza resultados de tableros repetidos")
+    load.add_argument("source", nargs="?", default="input.txt", help="laberintos a mandar en cada pedido")
+    load.add_argument("--connections", type=int, default=8)
+    load.add_argument("--requests", type=int, default=100, help="pedidos por conexion")
+    args = parser.parse_args(argv)
+
+    if args.command == "serve":
+        algos = args.algos.split(",")
+        for algo in algos:
+            if algo not in SOLVERS:
+                parser.error(f"algoritmo desconocido: {algo}")
+        cache = None
+        if not args.no_cache:
+            cache = ResultCache()
+            if args.cache_file:
+                cache.open_store(args.cache_file, args.cache_max_entries)
+        server = SolveServer(args.workers or None, algos, cache, args.chunk_size, args.batch_delay_ms,
+                             args.max_batch, args.max_inflight, args.max_cells)
+        try:
+            asyncio.run(server.serve(args.host, args.port, args.unix))
+        except (KeyboardInterrupt, asyncio.CancelledError):
+            pass
+        finally:
+            if cache is not None:
+                cache.close()
+        print(f"Pedidos atendidos: {server.requests} en {server.batches} lotes")
+        return 0
+
+    mazes = list(iter_mazes(args.source))
+    if not mazes:
+        print("No se cargo laberinto.")
+        return 1
+    buffer = io.StringIO()
+    write_text_to(buffer, mazes)
+    payload = buffer.getvalue().encode()
+    latencies, errors, elapsed = asyncio.run(load_test(payload, args.connections, args.requests,
+                                                       args.host, args.port, args.unix))
+    print(f"Pedidos: {len(latencies)} ({errors} con error) en {elapsed:.2f} s -> "
+          f"{len(latencies) / elapsed:.1f} pedidos/s, {len(latencies) * len(mazes) / elapsed:.1f} laberintos/s")
+    if latencies:
+        print("Latencia (ms): " + "  ".join(f"{name} {latency * 1000:.2f}" for name, latency in (
+            ("p50", _percentile(latencies, 0.5)), ("p95", _percentile(latencies, 0.95)),
+            ("p99", _percentile(latencies, 0.99)), ("max", latencies[-1]))))
+    return 1 if errors else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
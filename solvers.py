@@ -0,0 +1,2174 @@
+import sys
+import os
+import time
+import threading
+from collections import deque, OrderedDict
+from itertools import chain
+from array import array
+import bisect
+import hashlib
+import heapq
+import math 
+
+# Nucleo sin interfaz: laberintos, solvers, caches, parser y salida por
+# consola. numpy, sqlite3 y concurrent.futures se importan recien cuando
+# hacen falta: cargarlos tarda mas que una corrida corta entera.
+np = None
+_numpy_checked = False
+
+DISTANCE_CACHE_MAX_CELLS = 16_000_000
+RESULT_CACHE_MAX_ENTRIES = 100_000
+RESULT_CACHE_MAX_CELLS = 8_000_000
+RESULT_STORE_MAX_ENTRIES = 1_000_000
+RESULT_STORE_BATCH = 256
+NUMPY_BFS_MIN_CELLS = 1_000_000
+NUMPY_BFS_MIN_LAYER = 64
+WORKSPACE_MAX_CELLS = 4_000_000
+WORKSPACE_RESET_SHARE = 64
+
+
+def load_numpy():
+    global np, _numpy_checked
+    if not _numpy_checked:
+        _numpy_checked = True
+        try:
+            import numpy
+        except ImportError:
+            return None
+        np = numpy
+    return np
+
+
+def _typecode(cells):
+    return cells.typecode if isinstance(cells, array) else cells.format
+
+
+def _grid_array(values):
+    # Arreglo plano con el tipo mas angosto que alcanza para todos los saltos.
+    values = values if isinstance(values, array) else array('q', values)
+    if not values:
+        return array('B')
+    low, high = min(values), max(values)
+    for unsigned, signed, bits in (('B', 'b', 8), ('H', 'h', 16), ('I', 'i', 32), ('Q', 'q', 64)):
+        if low >= 0 and high < 1 << bits:
+            typecode = unsigned
+            break
+        if -(1 << (bits - 1)) <= low and high < 1 << (bits - 1):
+            typecode = signed
+            break
+    if values.typecode == typecode:
+        return values
+    return array(typecode, values)
+
+
+class GridRow:
+    # Fila de GridView. Leer va directo a Maze.cells; escribir pasa por
+    # Maze.set_jump, que ensancha el arreglo si hace falta e invalida las
+    # caches (adyacencia, componentes, huella, campos vivos).
+    __slots__ = ('_maze', '_r')
+
+    def __init__(self, maze, r):
+        self._maze = maze
+        self._r = r
+
+    def __len__(self):
+        return self._maze.n
+
+    def _index(self, c):
+        n = self._maze.n
+        if c < 0:
+            c += n
+        if not 0 <= c < n:
+            raise IndexError("columna fuera de rango")
+        return c
+
+    def __getitem__(self, c):
+        start = self._r * self._maze.n
+        if isinstance(c, slice):
+            return self.tolist()[c]
+        return self._maze.cells[start + self._index(c)]
+
+    def __setitem__(self, c, value):
+        if isinstance(c, slice):
+            columns = range(self._maze.n)[c]
+            values = list(value)
+            if len(values) != len(columns):
+                raise ValueError("la cantidad de valores no coincide con las columnas")
+            for col, val in zip(columns, values):
+                self._maze.set_jump((self._r, col), val)
+            return
+        self._maze.set_jump((self._r, self._index(c)), value)
+
+    def __iter__(self):
+        return iter(self.tolist())
+
+    def __eq__(self, other):
+        if isinstance(other, GridRow):
+            other = other.tolist()
+        try:
+            return self.tolist() == list(other)
+        except TypeError:
+            return NotImplemented
+
+    def tolist(self):
+        n = self._maze.n
+        return list(self._maze.cells[self._r * n:(self._r + 1) * n])
+
+    def __repr__(self):
+        return repr(self.tolist())
+
+
+class GridView:
+    # Vista de solo filas sobre Maze.cells para que grid[r][c] siga funcionando.
+    __slots__ = ('_maze',)
+
+    def __init__(self, maze):
+        self._maze = maze
+
+    def __len__(self):
+        return self._maze.m
+
+    def __getitem__(self, r):
+        if r < 0:
+            r += self._maze.m
+        if not 0 <= r < self._maze.m:
+            raise IndexError("fila fuera de rango")
+        return GridRow(self._maze, r)
+
+    def __iter__(self):
+        for r in range(self._maze.m):
+            yield GridRow(self._maze, r)
+
+
+class Maze:
+    __slots__ = ('m', 'n', 'start_pos', 'goal_pos', 'cells', '_adjacency', '_components', '_fingerprint',
+                 '_max_jump', '_live_fields')
+
+    def __init__(self, m, n, start_pos, goal_pos, grid):
+        self.m = m
+        self.n = n
+        self.start_pos = start_pos 
+        self.goal_pos = goal_pos   
+        if isinstance(grid, memoryview):
+            self.cells = grid
+        else:
+            self.cells = _grid_array(grid if isinstance(grid, array) else chain.from_iterable(grid))
+        self._adjacency = None
+        self._components = None
+        self._fingerprint = None
+        self._max_jump = None
+        self._live_fields = {}
+
+    def __reduce__(self):
+        cells = self.cells if isinstance(self.cells, array) else array(_typecode(self.cells), self.cells)
+        return (Maze, (self.m, self.n, self.start_pos, self.goal_pos, cells))
+
+    @property
+    def grid(self):
+        return GridView(self)
+
+    def get_jump_value(self, pos):
+        r, c = pos
+        if 0 <= r < self.m and 0 <= c < self.n:
+            return self.cells[r * self.n + c]
+        return 0 
+
+    def cell_id(self, pos):
+        r, c = pos
+        return r * self.n + c
+
+    def cell_pos(self, cell):
+        return divmod(cell, self.n)
+
+    def max_jump(self):
+        if self._max_jump is None:
+            self._max_jump = max(max(self.cells), -min(self.cells))
+        return self._max_jump
+
+    def successors(self, cell):
+        jump = self.get_jump_value(self.cell_pos(cell))
+        if not jump:
+            return []
+        r, c = self.cell_pos(cell)
+        return [self.cell_id(pos) for pos in ((r - jump, c), (r + jump, c), (r, c - jump), (r, c + jump))
+                if self.is_valid(pos)]
+
+    def set_jump(self, pos, value):
+        cell = self.cell_id(pos)
+        old = self.successors(cell)
+        if isinstance(self.cells, memoryview):
+            self.cells = array(self.cells.format, self.cells)
+        try:
+            self.cells[cell] = value
+        except OverflowError:
+            self.cells = _grid_array(chain(self.cells, (value,)))[:-1]
+            self.cells[cell] = value
+        self._adjacency = None
+        self._components = None
+        self._fingerprint = None
+        self._max_jump = None
+        new = self.successors(cell)
+        for field in self._live_fields.values():
+            field.update(cell, old, new)
+
+    def track_distance(self, goal_pos=None):
+        goal_pos = goal_pos if goal_pos is not None else self.goal_pos
+        if goal_pos not in self._live_fields:
+            self._live_fields[goal_pos] = DynamicDistanceField(self, goal_pos)
+        return self._live_fields[goal_pos]
+
+    def fingerprint(self):
+        # Se resume la grilla en su tipo mas angosto (_grid_array): el mismo
+        # tablero da la misma huella aunque set_jump lo haya ensanchado.
+        if self._fingerprint is None:
+            cells = self.cells if isinstance(self.cells, array) else array(_typecode(self.cells), self.cells)
+            cells = _grid_array(cells)
+            digest = hashlib.blake2b(digest_size=16)
+            digest.update(array('i', (self.m, self.n)).tobytes())
+            digest.update(cells.typecode.encode())
+            digest.update(cells.tobytes())
+            self._fingerprint = digest.hexdigest()
+        return self._fingerprint
+
+    def distance_field(self, goal_pos=None):
+        goal_pos = goal_pos if goal_pos is not None else self.goal_pos
+        if goal_pos in self._live_fields:
+            return self._live_fields[goal_pos].dist
+        return DISTANCE_FIELDS.get(self, goal_pos)
+
+    def distance(self, start_pos=None, goal_pos=None):
+        field = self.distance_field(goal_pos)
+        moves = field[self.cell_id(start_pos if start_pos is not None else self.start_pos)]
+        return moves if moves >= 0 else None
+
+    def path_from(self, start_pos=None, goal_pos=None):
+        field = self.distance_field(goal_pos)
+        cell = self.cell_id(start_pos if start_pos is not None else self.start_pos)
+        if field[cell] < 0:
+            return None
+        path = [self.cell_pos(cell)]
+        while field[cell]:
+            remaining = field[cell] - 1
+            for nxt in self.successors(cell):
+                if field[nxt] == remaining:
+                    cell = nxt
+                    break
+            path.append(self.cell_pos(cell))
+        return path
+
+    def can_reach(self, goal_pos=None):
+        field = self.distance_field(goal_pos)
+        return [self.cell_pos(cell) for cell in range(len(field)) if field[cell] >= 0]
+
+    def components(self, stop=None):
+        # Con stop el calculo se puede cortar (ver Components); si se corta
+        # devuelve None y no guarda nada.
+        if self._components is None:
+            components = Components(self.adjacency(), stop)
+            if components.component is None:
+                return None
+            self._components = components
+        return self._components
+
+    def reachable(self, start_pos=None, goal_pos=None):
+        goal_pos = goal_pos if goal_pos is not None else self.goal_pos
+        start = self.cell_id(start_pos if start_pos is not None else self.start_pos)
+        if goal_pos in self._live_fields:
+            return self._live_fields[goal_pos].dist[start] >= 0
+        return self.components().reachable(start, self.cell_id(goal_pos))
+
+    def adjacency(self):
+        if self._adjacency is None:
+            self._adjacency = self._build_adjacency()
+        return self._adjacency
+
+    def _build_adjacency(self):
+        m, n = self.m, self.n
+        offsets = array('i', [0]) * (m * n + 1)
+        targets = array('i')
+        push = targets.append
+        for cell, jump in enumerate(self.cells):
+            if jump:
+                r, c = divmod(cell, n)
+                for nr, nc in ((r - jump, c), (r + jump, c), (r, c - jump), (r, c + jump)):
+                    if 0 <= nr < m and 0 <= nc < n:
+                        push(nr * n + nc)
+            offsets[cell + 1] = len(targets)
+        return Adjacency(offsets, targets)
+
+    def is_valid(self, pos):
+        r, c = pos
+        return 0 <= r < self.m and 0 <= c < self.n
+
+    def get_neighbors(self, pos):
+        r, c = pos
+        jump_value = self.get_jump_value(pos)
+        neighbors = []
+
+        if jump_value == 0: 
+            return []
+
+        moves = [
+            (r - jump_value, c), 
+            (r + jump_value, c), 
+            (r, c - jump_value), 
+            (r, c + jump_value), 
+        ]
+
+        for next_pos in moves:
+            if self.is_valid(next_pos):
+                neighbors.append(next_pos)
+        return neighbors
+
+class Adjacency:
+    # Lista de adyacencia comprimida (CSR): los vecinos de la celda i son
+    # targets[offsets[i]:offsets[i + 1]], en el mismo orden que get_neighbors.
+    def __init__(self, offsets, targets):
+        self.offsets = offsets
+        self.targets = targets
+        self._reverse = None
+
+    def __len__(self):
+        return len(self.offsets) - 1
+
+    def neighbors(self, cell):
+        return self.targets[self.offsets[cell]:self.offsets[cell + 1]]
+
+    def out_degree(self, cell):
+        return self.offsets[cell + 1] - self.offsets[cell]
+
+    def in_degree(self, cell):
+        return self.reverse().out_degree(cell)
+
+    def reverse(self):
+        if self._reverse is None:
+            size = len(self)
+            offsets = array('i', [0]) * (size + 1)
+            for target in self.targets:
+                offsets[target + 1] += 1
+            for cell in range(size):
+                offsets[cell + 1] += offsets[cell]
+            fill = array('i', offsets)
+            targets = array('i', [0]) * len(self.targets)
+            source_offsets = self.offsets
+            for source in range(size):
+                for k in range(source_offsets[source], source_offsets[source + 1]):
+                    target = self.targets[k]
+                    targets[fill[target]] = source
+                    fill[target] += 1
+            self._reverse = Adjacency(offsets, targets)
+            self._reverse._reverse = self
+        return self._reverse
+
+
+class Components:
+    # Componentes fuertemente conexas del grafo de saltos (Tarjan iterativo).
+    # Tarjan cierra una componente despues de todas las que alcanza, asi que
+    # si a llega a b entonces component[b] <= component[a]: con la misma
+    # componente la meta es alcanzable y con una mayor no lo es, ambas en O(1).
+    # El resto se resuelve sobre el grafo de componentes (un DAG), guardando
+    # lo alcanzable desde las ultimas componentes de origen consultadas.
+    # Con stop (un threading.Event) el recorrido mira la senal cada
+    # STOP_CHECK_CELLS celdas y, si se activo, deja component en None.
+    MAX_SOURCES = 8
+    STOP_CHECK_CELLS = 4096
+
+    def __init__(self, adjacency, stop=None):
+        self.adjacency = adjacency
+        self.component, self.count = self._tarjan(adjacency, stop)
+        self._dag = None
+        self._reach = OrderedDict()
+
+    def __len__(self):
+        return self.count
+
+    def same(self, a, b):
+        return self.component[a] == self.component[b]
+
+    def reachable(self, a, b):
+        source, target = self.component[a], self.component[b]
+        if source == target:
+            return True
+        if source < target:
+            return False
+        reach = self._reach.get(source)
+        if reach is None:
+            reach = self._reach[source] = self._reach_from(source)
+            if len(self._reach) > self.MAX_SOURCES:
+                self._reach.popitem(last=False)
+        else:
+            self._reach.move_to_end(source)
+        return bool(reach[target])
+
+    def _reach_from(self, source):
+        offsets, targets = self._condense()
+        reach = bytearray(self.count)
+        reach[source] = 1
+        stack = [source]
+        while stack:
+            comp = stack.pop()
+            for k in range(offsets[comp], offsets[comp + 1]):
+                nxt = targets[k]
+                if not reach[nxt]:
+                    reach[nxt] = 1
+                    stack.append(nxt)
+        return reach
+
+    def _condense(self):
+        # Aristas entre componentes distintas en formato CSR (pueden repetirse).
+        if self._dag is None:
+            component = self.component
+            offsets, targets = self.adjacency.offsets, self.adjacency.targets
+            dag_offsets = array('i', [0]) * (self.count + 1)
+            for cell in range(len(self.adjacency)):
+                comp = component[cell]
+                for k in range(offsets[cell], offsets[cell + 1]):
+                    if component[targets[k]] != comp:
+                        dag_offsets[comp + 1] += 1
+            for comp in range(self.count):
+                dag_offsets[comp + 1] += dag_offsets[comp]
+            fill = array('i', dag_offsets)
+            dag_targets = array('i', [0]) * dag_offsets[-1]
+            for cell in range(len(self.adjacency)):
+                comp = component[cell]
+                for k in range(offsets[cell], offsets[cell + 1]):
+                    other = component[targets[k]]
+                    if other != comp:
+                        dag_targets[fill[comp]] = other
+                        fill[comp] += 1
+            self._dag = (dag_offsets, dag_targets)
+        return self._dag
+
+    @classmethod
+    def _tarjan(cls, adjacency, stop=None):
+        offsets, targets = adjacency.offsets, adjacency.targets
+        size = len(adjacency)
+        index = array('i', [-1]) * size
+        low = array('i', [0]) * size
+        component = array('i', [-1]) * size
+        next_edge = array('i', offsets)
+        stack = array('i')
+        call = array('i')
+        counter = 0
+        count = 0
+        for root in range(size):
+            if index[root] >= 0:
+                continue
+            index[root] = low[root] = counter
+            counter += 1
+            stack.append(root)
+            call.append(root)
+            while call:
+                v = call[-1]
+                k = next_edge[v]
+                if k < offsets[v + 1]:
+                    next_edge[v] = k + 1
+                    w = targets[k]
+                    if index[w] < 0:
+                        index[w] = low[w] = counter
+                        counter += 1
+                        stack.append(w)
+                        call.append(w)
+                        if stop is not None and counter % cls.STOP_CHECK_CELLS == 0 and stop.is_set():
+                            return None, 0
+                    elif component[w] < 0 and index[w] < low[v]:
+                        # Visitada y sin componente: sigue en la pila.
+                        low[v] = index[w]
+                    continue
+                call.pop()
+                if call and low[v] < low[call[-1]]:
+                    low[call[-1]] = low[v]
+                if low[v] == index[v]:
+                    while True:
+                        w = stack.pop()
+                        component[w] = count
+                        if w == v:
+                            break
+                    count += 1
+        return component, count
+
+
+class DistanceFieldCache:
+    # Campos de distancia hacia una meta (BFS inverso), uno por
+    # (huella del laberinto, meta). LRU acotado por el total de celdas guardadas.
+    def __init__(self, max_cells=DISTANCE_CACHE_MAX_CELLS):
+        self.max_cells = max_cells
+        self._fields = OrderedDict()
+        self._cells = 0
+
+    def __len__(self):
+        return len(self._fields)
+
+    def clear(self):
+        self._fields.clear()
+        self._cells = 0
+
+    def get(self, maze, goal_pos):
+        key = (maze.fingerprint(), goal_pos)
+        field = self._fields.get(key)
+        if field is not None:
+            self._fields.move_to_end(key)
+            return field
+
+        field = self.compute(maze, goal_pos)
+        self._fields[key] = field
+        self._cells += len(field)
+        while self._cells > self.max_cells and len(self._fields) > 1:
+            _, evicted = self._fields.popitem(last=False)
+            self._cells -= len(evicted)
+        return field
+
+    @staticmethod
+    def compute(maze, goal_pos):
+        reverse = maze.adjacency().reverse()
+        offsets, targets = reverse.offsets, reverse.targets
+        field = array('i', [-1]) * len(reverse)
+        goal = maze.cell_id(goal_pos)
+        field[goal] = 0
+        queue = array('i', (goal,))
+        push = queue.append
+        head = 0
+        while head < len(queue):
+            cell = queue[head]
+            head += 1
+            depth = field[cell] + 1
+            for k in range(offsets[cell], offsets[cell + 1]):
+                nxt = targets[k]
+                if field[nxt] < 0:
+                    field[nxt] = depth
+                    push(nxt)
+        return field
+
+
+DISTANCE_FIELDS = DistanceFieldCache()
+
+
+class SearchWorkspace:
+    # Buffers por celda de las busquedas sin historial (solve()), reutilizados
+    # entre llamadas del mismo hilo y del tamano del laberinto mas grande visto
+    # (hasta WORKSPACE_MAX_CELLS). Cada busqueda registra la lista de celdas
+    # que marca y el buffer se limpia al pedirlo de nuevo, deshaciendo solo
+    # esas: una busqueda que termina cerca del inicio de un tablero enorme no
+    # paga O(celdas) en reservar y llenar. Si la anterior toco mas de
+    # 1/WORKSPACE_RESET_SHARE de sus celdas se suelta el buffer, porque
+    # reservarlo de nuevo (en C) sale mas barato que deshacer celda por celda.
+    # Los buffers sin lista (parent) no se limpian: solo se leen en celdas
+    # marcadas por la busqueda actual.
+    _local = threading.local()
+
+    def __init__(self):
+        self._buffers = {}
+        self._pending = {}
+
+    @classmethod
+    def current(cls):
+        workspace = getattr(cls._local, "workspace", None)
+        if workspace is None:
+            workspace = cls._local.workspace = cls()
+        return workspace
+
+    def marks(self, name, size, touched=None):
+        return self._take(name, size, touched, bytearray)
+
+    def ints(self, name, size, touched=None):
+        return self._take(name, size, touched, lambda size: array('i', [-1]) * size)
+
+    def _take(self, name, size, touched, make):
+        self._clear(name)
+        if size > WORKSPACE_MAX_CELLS:
+            self._buffers.pop(name, None)
+            return make(size)
+        buffer = self._buffers.get(name)
+        if buffer is None or len(buffer) < size:
+            buffer = self._buffers[name] = make(size)
+        if touched is not None:
+            self._pending[name] = (touched, size)
+        return buffer
+
+    def _clear(self, name):
+        pending = self._pending.pop(name, None)
+        if pending is None:
+            return
+        touched, size = pending
+        buffer = self._buffers[name]
+        if len(touched) * WORKSPACE_RESET_SHARE > size:
+            del self._buffers[name]
+            return
+        empty = 0 if isinstance(buffer, bytearray) else -1
+        for cell in touched:
+            buffer[cell] = empty
+
+
+class DynamicDistanceField:
+    # Campo de distancia que se repara al cambiar el salto de una celda
+    # (Maze.set_jump). Solo cambian las aristas que salen de esa celda: primero
+    # las nuevas, que solo pueden bajar distancias (BFS desde ahi), y luego las
+    # que desaparecen, que solo pueden subirlas (se recalcula solo la region
+    # que perdio su soporte).
+    # Los predecesores salen de un CSR inverso mas parches; se recompacta
+    # cuando los parches crecen demasiado.
+    def __init__(self, maze, goal_pos):
+        self.maze = maze
+        self.goal = maze.cell_id(goal_pos)
+        self.dist = array('i', DISTANCE_FIELDS.get(maze, goal_pos))
+        self._compact()
+
+    def _compact(self):
+        reverse = self.maze.adjacency().reverse()
+        self._offsets, self._targets = reverse.offsets, reverse.targets
+        self._added = {}
+        self._removed = set()
+        self._patches = 0
+
+    def _predecessors(self, cell):
+        preds = [self._targets[k] for k in range(self._offsets[cell], self._offsets[cell + 1])
+                 if (self._targets[k], cell) not in self._removed]
+        preds.extend(self._added.get(cell, ()))
+        return preds
+
+    def update(self, cell, old, new):
+        removed = [nxt for nxt in old if nxt not in new]
+        added = [nxt for nxt in new if nxt not in old]
+        for nxt in removed:
+            preds = self._added.get(nxt)
+            if preds and cell in preds:
+                preds.remove(cell)
+            else:
+                self._removed.add((cell, nxt))
+        for nxt in added:
+            if (cell, nxt) in self._removed:
+                self._removed.discard((cell, nxt))
+            else:
+                self._added.setdefault(nxt, []).append(cell)
+        self._patches += len(removed) + len(added)
+
+        for nxt in added:
+            self._repair_decrease(cell, nxt)
+        if removed:
+            self._repair_increase(cell)
+
+        if self._patches > max(1024, len(self.dist) // 8):
+            self._compact()
+
+    def _supported(self, cell, affected):
+        if cell == self.goal:
+            return True
+        remaining = self.dist[cell] - 1
+        return any(self.dist[nxt] == remaining and nxt not in affected
+                   for nxt in self.maze.successors(cell))
+
+    def _repair_increase(self, cell):
+        dist = self.dist
+        if dist[cell] < 0:
+            return
+        affected = set()
+        queue = deque([cell])
+        while queue:
+            current = queue.popleft()
+            if current in affected or self._supported(current, affected):
+                continue
+            affected.add(current)
+            for pred in self._predecessors(current):
+                if dist[pred] == dist[current] + 1 and pred not in affected:
+                    queue.append(pred)
+        if not affected:
+            return
+
+        heap = []
+        for current in affected:
+            best = -1
+            for nxt in self.maze.successors(current):
+                if nxt not in affected and dist[nxt] >= 0 and (best < 0 or dist[nxt] + 1 < best):
+                    best = dist[nxt] + 1
+            if best >= 0:
+                heap.append((best, current))
+        for current in affected:
+            dist[current] = -1
+        heapq.heapify(heap)
+        while heap:
+            depth, current = heapq.heappop(heap)
+            if dist[current] >= 0:
+                continue
+            dist[current] = depth
+            for pred in self._predecessors(current):
+                if pred in affected and dist[pred] < 0:
+                    heapq.heappush(heap, (depth + 1, pred))
+
+    def _repair_decrease(self, cell, nxt):
+        dist = self.dist
+        if dist[nxt] < 0 or 0 <= dist[cell] <= dist[nxt] + 1:
+            return
+        dist[cell] = dist[nxt] + 1
+        queue = deque([cell])
+        while queue:
+            current = queue.popleft()
+            depth = dist[current] + 1
+            for pred in self._predecessors(current):
+                if dist[pred] < 0 or dist[pred] > depth:
+                    dist[pred] = depth
+                    queue.append(pred)
+
+
+class SolverState:
+    __slots__ = ('current_node', 'path_to_current', 'frontier', 'visited', 'final_path', 'message')
+
+    def __init__(self, current_node, path, frontier, visited, final_path=None, message=""):
+        self.current_node = current_node 
+        self.path_to_current = path 
+        self.frontier = set(frontier) 
+        self.visited = set(visited) 
+        self.final_path = final_path 
+        self.message = message 
+
+
+class SolverHistory:
+    # Historial delta: cada paso guarda solo lo que cambio (nodo actual, nodos
+    # agregados/quitados de la frontera y nodos visitados) en arreglos de ids
+    # de celda (r * n + c). Los estados completos se reconstruyen bajo demanda
+    # moviendo un cursor, con keyframes periodicos para saltos largos.
+    #
+    # Un solo hilo escribe (el solver) y otro lee (la vista). Los eventos solo
+    # se agregan al final de los arreglos y commit publica el paso agregando
+    # _nodes al ultimo, asi que el lector nunca mira mas alla de un paso
+    # completo. El lock mantiene coherentes commit y las lecturas del cursor.
+    KEYFRAME_MIN_EVENTS = 1024
+
+    def __init__(self, maze):
+        self.maze = maze
+        self._nodes = array('i')
+        self._pushed = array('i')
+        self._pushed_end = array('i')
+        self._popped = array('i')
+        self._popped_end = array('i')
+        self._visited = array('i')
+        self._visited_end = array('i')
+        self._parent_of = {}
+        self._messages = {}
+        self._final_paths = {}
+        self._keyframes = []
+        self._keyframe_steps = []
+
+        self._cursor = -1
+        self._cursor_frontier = {}
+        self._cursor_frontier_size = 0
+        self._cursor_visited = set()
+        self._cached_index = -1
+        self._cached_state = None
+        self.lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._nodes)
+
+    def add_frontier(self, cell):
+        self._pushed.append(cell)
+
+    def remove_frontier(self, cell):
+        self._popped.append(cell)
+
+    def add_visited(self, cell):
+        self._visited.append(cell)
+
+    def commit(self, current, parent=-1, message="", final_path=None):
+        with self.lock:
+            step = len(self._nodes)
+            self._pushed_end.append(len(self._pushed))
+            self._popped_end.append(len(self._popped))
+            self._visited_end.append(len(self._visited))
+            if current >= 0 and current not in self._parent_of:
+                self._parent_of[current] = parent
+            if message:
+                self._messages[step] = message
+            if final_path:
+                self._final_paths[step] = final_path
+            self._nodes.append(current)
+        return step
+
+    def state(self, index):
+        if not 0 <= index < len(self._nodes):
+            return None
+        if index != self._cached_index:
+            with self.lock:
+                self._seek(index)
+                self._cached_state = self._materialize(index)
+            self._cached_index = index
+        return self._cached_state
+
+    def seek(self, index):
+        if 0 <= index < len(self._nodes):
+            with self.lock:
+                self._seek(index)
+
+    @property
+    def visited_cells(self):
+        return self._cursor_visited
+
+    @property
+    def frontier_cells(self):
+        return self._cursor_frontier
+
+    def node(self, index):
+        return self._nodes[index] if 0 <= index < len(self._nodes) else -1
+
+    def pushed_since(self, start):
+        return self._pushed[start:]
+
+    def frontier_size(self):
+        return len(self._pushed) - len(self._popped)
+
+    def message(self, index):
+        return self._messages.get(index, "")
+
+    def final_path(self, index):
+        return self._final_paths.get(index)
+
+    def changed_cells(self, a, b):
+        # Celdas cuyo estado puede diferir entre los pasos a y b.
+        if a > b:
+            a, b = b, a
+        with self.lock:
+            return self._changed_cells(a, b)
+
+    def _changed_cells(self, a, b):
+        cells = set()
+        for events, ends in ((self._pushed, self._pushed_end), (self._popped, self._popped_end),
+                             (self._visited, self._visited_end)):
+            start = ends[a] if a >= 0 else 0
+            cells.update(events[start:ends[b]])
+        for step in (a, b):
+            if step >= 0:
+                if self._nodes[step] >= 0:
+                    cells.add(self._nodes[step])
+                for pos in self._final_paths.get(step) or ():
+                    cells.add(self.maze.cell_id(pos))
+        return cells
+
+    def path_to(self, cell):
+        path = []
+        while cell >= 0:
+            path.append(self.maze.cell_pos(cell))
+            cell = self._parent_of.get(cell, -1)
+        path.reverse()
+        return path
+
+    def _materialize(self, index):
+        cell_pos = self.maze.cell_pos
+        current = self._nodes[index]
+        return SolverState(
+            cell_pos(current) if current >= 0 else None,
+            self.path_to(current) if current >= 0 else [],
+            [cell_pos(cell) for cell in self._cursor_frontier],
+            [cell_pos(cell) for cell in self._cursor_visited],
+            self._final_paths.get(index),
+            self._messages.get(index, ""),
+        )
+
+    def _events_until(self, index):
+        if index < 0:
+            return 0
+        return self._pushed_end[index] + self._popped_end[index] + self._visited_end[index]
+
+    def _seek(self, index):
+        cost_cursor = abs(self._events_until(index) - self._events_until(self._cursor))
+        k = bisect.bisect_right(self._keyframe_steps, index) - 1
+        if k >= 0:
+            kf_step, kf_frontier, kf_visited = self._keyframes[k]
+            cost_keyframe = len(kf_frontier) + len(kf_visited) + self._events_until(index) - self._events_until(kf_step)
+            if cost_keyframe < cost_cursor and (self._cursor < kf_step or self._cursor > index):
+                self._cursor_frontier = {}
+                for cell in kf_frontier:
+                    self._cursor_frontier[cell] = self._cursor_frontier.get(cell, 0) + 1
+                self._cursor_frontier_size = len(kf_frontier)
+                self._cursor_visited = set(kf_visited)
+                self._cursor = kf_step
+        elif self._cursor > index and self._events_until(index) < cost_cursor:
+            self._cursor_frontier = {}
+            self._cursor_frontier_size = 0
+            self._cursor_visited = set()
+            self._cursor = -1
+
+        while self._cursor < index:
+            self._cursor += 1
+            self._apply(self._cursor, 1)
+            self._maybe_keyframe()
+        while self._cursor > index:
+            self._apply(self._cursor, -1)
+            self._cursor -= 1
+
+    def _apply(self, step, sign):
+        frontier = self._cursor_frontier
+        visited = self._cursor_visited
+        start = self._pushed_end[step - 1] if step > 0 else 0
+        self._cursor_frontier_size += sign * (self._pushed_end[step] - start)
+        for cell in self._pushed[start:self._pushed_end[step]]:
+            count = frontier.get(cell, 0) + sign
+            if count:
+                frontier[cell] = count
+            else:
+                del frontier[cell]
+        start = self._popped_end[step - 1] if step > 0 else 0
+        self._cursor_frontier_size -= sign * (self._popped_end[step] - start)
+        for cell in self._popped[start:self._popped_end[step]]:
+            count = frontier.get(cell, 0) - sign
+            if count:
+                frontier[cell] = count
+            else:
+                del frontier[cell]
+        start = self._visited_end[step - 1] if step > 0 else 0
+        if sign > 0:
+            visited.update(self._visited[start:self._visited_end[step]])
+        else:
+            visited.difference_update(self._visited[start:self._visited_end[step]])
+
+    def _maybe_keyframe(self):
+        step = self._cursor
+        last = self._keyframe_steps[-1] if self._keyframe_steps else -1
+        if step <= last:
+            return
+        size = self._cursor_frontier_size + len(self._cursor_visited)
+        if self._events_until(step) - self._events_until(last) < max(size, self.KEYFRAME_MIN_EVENTS):
+            return
+        frontier = array('i')
+        for cell, count in self._cursor_frontier.items():
+            frontier.extend([cell] * count)
+        self._keyframes.append((step, frontier, array('i', self._cursor_visited)))
+        self._keyframe_steps.append(step)
+
+
+class SolverStats:
+    # Contadores y tiempos de un solver creado con Solver.instrumented.
+    __slots__ = ('steps', 'expanded', 'generated', 'duplicates', 'max_frontier',
+                 'step_s', 'record_s', 'neighbors_s', 'render_s', 'frames', '_pushed_seen', '_seen')
+    FIELDS = ('steps', 'expanded', 'generated', 'duplicates', 'max_frontier',
+              'step_s', 'record_s', 'neighbors_s', 'render_s', 'frames')
+
+    def __init__(self, cells):
+        self.steps = 0
+        self.expanded = 0
+        self.generated = 0
+        self.duplicates = 0
+        self.max_frontier = 0
+        self.step_s = 0.0
+        self.record_s = 0.0
+        self.neighbors_s = 0.0
+        self.render_s = 0.0
+        self.frames = 0
+        self._pushed_seen = 0
+        self._seen = bytearray(cells)
+
+    def as_dict(self):
+        return {name: getattr(self, name) for name in self.FIELDS}
+
+    def lines(self):
+        return [
+            f"Pasos: {self.steps}",
+            f"Expandidos: {self.expanded}",
+            f"Vecinos generados: {self.generated}",
+            f"Empujes repetidos: {self.duplicates}",
+            f"Frontera maxima: {self.max_frontier}",
+            f"step: {self.step_s * 1000:.1f} ms",
+            f"_record_state: {self.record_s * 1000:.1f} ms",
+            f"Adyacencia: {self.neighbors_s * 1000:.1f} ms",
+            f"Dibujo: {self.render_s * 1000:.1f} ms / {self.frames} cuadros",
+        ]
+
+
+class Solver:
+    stats = None
+
+    def __init__(self, maze):
+        self.maze = maze
+        self.goal_cell = maze.cell_id(maze.goal_pos)
+        self.adjacency = maze.adjacency()
+        self.history = SolverHistory(maze)
+        self.current_step_index = -1
+        self.message = ""
+        self._clear_search()
+
+    @property
+    def solution_path(self):
+        if self._solution_cell < 0:
+            return None
+        if self._solution_path is None:
+            self._solution_path = self.path_to(self._solution_cell)
+        return self._solution_path
+
+    def path_to(self, cell):
+        path = []
+        while cell >= 0:
+            path.append(self.maze.cell_pos(cell))
+            cell = self.parent[cell]
+        path.reverse()
+        return path
+
+    @staticmethod
+    def solve(maze):
+        raise NotImplementedError
+
+    def step(self):
+        raise NotImplementedError
+
+    def run_all(self):
+        if self.precheck():
+            while self.step():
+                pass
+        self.current_step_index = len(self.history) - 1
+
+    def precheck(self):
+        # Si ya se sabe que la meta cae fuera de lo alcanzable no se busca.
+        # Solo se usan componentes ya calculadas: calcularlas aqui recorre todo
+        # el tablero sin poder detenerse (SolverRunner.stop esperaria).
+        if self.maze._components is None or self.maze.reachable():
+            return True
+        self.give_up()
+        return False
+
+    def give_up(self):
+        # Vacia la frontera; el paso siguiente registra "No hay solución".
+        self._drop_frontier()
+        self.step()
+
+    def get_current_state(self):
+        return self.history.state(self.current_step_index)
+
+    def next_step(self):
+        if self.current_step_index < len(self.history) - 1:
+            self.current_step_index += 1
+            return True
+        return False
+
+    def prev_step(self):
+        if self.current_step_index > 0:
+            self.current_step_index -= 1
+            return True
+        return False
+
+    @classmethod
+    def instrumented(cls, maze, *args, **kwargs):
+        # Solver con estadisticas. Los envoltorios de step y _record_state se
+        # instalan en la instancia, asi que un solver normal no paga nada.
+        # Los vecinos se generan al armar la adyacencia del laberinto, que es
+        # lo que se mide como tiempo de vecinos (cero si ya estaba armada).
+        solver = cls.__new__(cls)
+        solver.stats = SolverStats(maze.m * maze.n)
+        start = time.perf_counter()
+        maze.adjacency()
+        solver.stats.neighbors_s = time.perf_counter() - start
+        solver.step = solver._instrumented_step
+        solver._record_state = solver._instrumented_record_state
+        solver.__init__(maze, *args, **kwargs)
+        return solver
+
+    def _instrumented_step(self):
+        stats = self.stats
+        expanded = self.expanded
+        start = time.perf_counter()
+        more = type(self).step(self)
+        stats.step_s += time.perf_counter() - start
+        stats.steps += 1
+        stats.expanded = self.expanded
+        if self.expanded > expanded:
+            node = self.history.node(len(self.history) - 1)
+            if node >= 0:
+                stats.generated += self._step_adjacency().out_degree(node)
+
+        pushed = self.history.pushed_since(stats._pushed_seen)
+        stats._pushed_seen += len(pushed)
+        seen = stats._seen
+        for cell in pushed:
+            if seen[cell]:
+                stats.duplicates += 1
+            else:
+                seen[cell] = 1
+        stats.max_frontier = max(stats.max_frontier, self.history.frontier_size())
+        return more
+
+    def _step_adjacency(self):
+        # Grafo que uso el ultimo paso para generar vecinos.
+        return self.adjacency
+
+    def _instrumented_record_state(self, current_cell, parent_cell=-1, message=""):
+        start = time.perf_counter()
+        type(self)._record_state(self, current_cell, parent_cell, message)
+        self.stats.record_s += time.perf_counter() - start
+
+    def reset(self):
+        self.history = SolverHistory(self.maze)
+        self.current_step_index = -1
+        self.message = ""
+        if self.stats is not None:
+            neighbors_s = self.stats.neighbors_s
+            self.stats = SolverStats(self.maze.m * self.maze.n)
+            self.stats.neighbors_s = neighbors_s
+        self._clear_search()
+        self._initialize_search() 
+
+    def _clear_search(self):
+        cells = self.maze.m * self.maze.n
+        self.visited = bytearray(cells)
+        self.parent = array('i', [-1]) * cells
+        self._solution_cell = -1
+        self._solution_path = None
+        self.expanded = 0
+
+    def _initialize_search(self):
+        raise NotImplementedError
+
+    def _drop_frontier(self):
+        raise NotImplementedError
+
+    def _found(self, cell):
+        self._solution_cell = cell
+        self.message = f"Solución encontrada en: {len(self.solution_path) - 1} movimientos"
+
+    def _record_state(self, current_cell, parent_cell=-1, message=""):
+        self.history.commit(current_cell, parent_cell, message, self.solution_path)
+
+class DFSSolver(Solver):
+    def __init__(self, maze):
+        super().__init__(maze)
+        self._initialize_search()
+
+    @staticmethod
+    def solve(maze):
+        adjacency = maze.adjacency()
+        offsets, targets = adjacency.offsets, adjacency.targets
+        size = len(adjacency)
+        goal = maze.cell_id(maze.goal_pos)
+        workspace = SearchWorkspace.current()
+        touched = array('i')
+        visited = workspace.marks("visited", size, touched)
+        parent = workspace.ints("parent", size)
+        stack = array('i', (maze.cell_id(maze.start_pos), -1))
+        pop = stack.pop
+        push = stack.append
+        mark = touched.append
+
+        while stack:
+            from_cell = pop()
+            cell = pop()
+            if visited[cell]:
+                continue
+            visited[cell] = 1
+            mark(cell)
+            parent[cell] = from_cell
+            if cell == goal:
+                return _unwind(maze, parent, cell)
+
+            for k in range(offsets[cell + 1] - 1, offsets[cell] - 1, -1):
+                nxt = targets[k]
+                if not visited[nxt]:
+                    push(nxt)
+                    push(cell)
+        return None, None
+
+    def _initialize_search(self):
+        start_cell = self.maze.cell_id(self.maze.start_pos)
+        self.stack = [(start_cell, -1)] 
+        self.history.add_frontier(start_cell)
+        self._record_state(-1) 
+
+    def _drop_frontier(self):
+        for cell, _ in self.stack:
+            self.history.remove_frontier(cell)
+        self.stack.clear()
+
+    def step(self):
+        while self.stack:
+            current, parent = self.stack.pop()
+            self.history.remove_frontier(current)
+            if not self.visited[current]:
+                break
+        else:
+            if not self.solution_path: 
+                 self.message = "No hay solución"
+                 self._record_state(-1, -1, self.message)
+            return False 
+
+        self.visited[current] = 1
+        self.parent[current] = parent
+        self.expanded += 1
+        self.history.add_visited(current)
+
+        if current == self.goal_cell:
+            self._found(current)
+            self._record_state(current, parent, self.message)
+            self.stack.clear() 
+            return False 
+
+        self._record_state(current, parent)
+
+        targets = self.adjacency.targets
+        for k in range(self.adjacency.offsets[current + 1] - 1, self.adjacency.offsets[current] - 1, -1): 
+            neighbor_cell = targets[k]
+            if not self.visited[neighbor_cell]:
+                self.stack.append((neighbor_cell, current))
+                self.history.add_frontier(neighbor_cell)
+
+        return True 
+
+
+class UCSSolver(Solver): 
+    def __init__(self, maze):
+        super().__init__(maze)
+        self._initialize_search()
+
+    @staticmethod
+    def solve(maze):
+        if maze.m * maze.n >= NUMPY_BFS_MIN_CELLS and load_numpy() is not None:
+            return _bfs_numpy(maze)
+
+        adjacency = maze.adjacency()
+        offsets, targets = adjacency.offsets, adjacency.targets
+        size = len(adjacency)
+        start = maze.cell_id(maze.start_pos)
+        goal = maze.cell_id(maze.goal_pos)
+        workspace = SearchWorkspace.current()
+        # La cola guarda justo las celdas marcadas.
+        queue = array('i', (start,))
+        visited = workspace.marks("visited", size, queue)
+        parent = workspace.ints("parent", size)
+        visited[start] = 1
+        parent[start] = -1
+        push = queue.append
+        head = 0
+
+        while head < len(queue):
+            cell = queue[head]
+            head += 1
+            if cell == goal:
+                return _unwind(maze, parent, cell)
+
+            for k in range(offsets[cell], offsets[cell + 1]):
+                nxt = targets[k]
+                if not visited[nxt]:
+                    visited[nxt] = 1
+                    parent[nxt] = cell
+                    push(nxt)
+        return None, None
+
+    def _initialize_search(self):
+        start_cell = self.maze.cell_id(self.maze.start_pos)
+        self.queue = deque([start_cell]) 
+        self.visited[start_cell] = 1
+        self.history.add_frontier(start_cell)
+        self.history.add_visited(start_cell)
+        self._record_state(-1) 
+
+    def _drop_frontier(self):
+        for cell in self.queue:
+            self.history.remove_frontier(cell)
+        self.queue.clear()
+
+
+    def step(self):
+        if not self.queue:
+            if not self.solution_path: 
+                 self.message = "No hay solución"
+                 self._record_state(-1, -1, self.message)
+            return False 
+
+        current = self.queue.popleft()
+        self.history.remove_frontier(current)
+        parent = self.parent[current]
+        self.expanded += 1
+
+        if current == self.goal_cell:
+            self._found(current)
+            self._record_state(current, parent, self.message)
+            self.queue.clear()
+            return False 
+
+        self._record_state(current, parent)
+
+        targets = self.adjacency.targets
+        for k in range(self.adjacency.offsets[current], self.adjacency.offsets[current + 1]):
+            neighbor_cell = targets[k]
+            if not self.visited[neighbor_cell]:
+                self.visited[neighbor_cell] = 1
+                self.parent[neighbor_cell] = current
+                self.queue.append(neighbor_cell)
+                self.history.add_frontier(neighbor_cell)
+                self.history.add_visited(neighbor_cell)
+
+        return True 
+
+class BidirectionalSolver(Solver):
+    # BFS desde el inicio y, sobre las aristas inversas, desde la meta. Se
+    # expande una capa completa del lado con la frontera mas chica; al terminar
+    # la primera capa donde ambos lados se tocan, el mejor cruce es optimo.
+    def __init__(self, maze):
+        super().__init__(maze)
+        self._initialize_search()
+
+    @staticmethod
+    def solve(maze):
+        adjacency = maze.adjacency()
+        sides = (
+            (adjacency.offsets, adjacency.targets),
+            (adjacency.reverse().offsets, adjacency.reverse().targets),
+        )
+        size = len(adjacency)
+        start = maze.cell_id(maze.start_pos)
+        goal = maze.cell_id(maze.goal_pos)
+        workspace = SearchWorkspace.current()
+        reached = (array('i', (start,)), array('i', (goal,)))
+        dist = (workspace.ints("dist", size, reached[0]), workspace.ints("dist_back", size, reached[1]))
+        parent = (workspace.ints("parent", size), workspace.ints("parent_back", size))
+        dist[0][start] = 0
+        dist[1][goal] = 0
+        parent[0][start] = -1
+        layers = ([start], [goal])
+        best, meet = -1, None
+        if start == goal:
+            best, meet = 0, (start, start)
+
+        while best < 0 and layers[0] and layers[1]:
+            side = 0 if len(layers[0]) <= len(layers[1]) else 1
+            offsets, targets = sides[side]
+            own_dist, other_dist, own_parent = dist[side], dist[1 - side], parent[side]
+            layer = []
+            for cell in layers[side]:
+                depth = own_dist[cell] + 1
+                for k in range(offsets[cell], offsets[cell + 1]):
+                    nxt = targets[k]
+                    if own_dist[nxt] < 0:
+                        own_dist[nxt] = depth
+                        own_parent[nxt] = cell
+                        layer.append(nxt)
+                    if other_dist[nxt] >= 0:
+                        length = depth + other_dist[nxt]
+                        if best < 0 or length < best:
+                            best = length
+                            meet = (cell, nxt) if side == 0 else (nxt, cell)
+            reached[side].extend(layer)
+            layers = (layer, layers[1]) if side == 0 else (layers[0], layer)
+
+        if meet is None:
+            return None, None
+        _splice(parent[0], parent[1], meet, goal)
+        return _unwind(maze, parent[0], goal)
+
+    def _initialize_search(self):
+        size = len(self.adjacency)
+        start_cell = self.maze.cell_id(self.maze.start_pos)
+        self.reverse_adjacency = self.adjacency.reverse()
+        self.dist = array('i', [-1]) * size
+        self.dist_back = array('i', [-1]) * size
+        self.parent_back = array('i', [-1]) * size
+        self.queue = deque([start_cell])
+        self.queue_back = deque([self.goal_cell])
+        self.dist[start_cell] = 0
+        self.dist_back[self.goal_cell] = 0
+        self.forward = True
+        self._layer_left = 0
+        self._best = -1
+        self._meet = None
+
+        self.visited[start_cell] = 1
+        self.history.add_frontier(start_cell)
+        self.history.add_visited(start_cell)
+        self.history.add_frontier(self.goal_cell)
+        if not self.visited[self.goal_cell]:
+            self.visited[self.goal_cell] = 1
+            self.history.add_visited(self.goal_cell)
+        self._record_state(-1)
+
+    def _drop_frontier(self):
+        for cell in chain(self.queue, self.queue_back):
+            self.history.remove_frontier(cell)
+        self.queue.clear()
+        self.queue_back.clear()
+
+    def step(self):
+        if self._layer_left == 0:
+            if self._meet is not None:
+                _splice(self.parent, self.parent_back, self._meet, self.goal_cell)
+                self._found(self.goal_cell)
+                self._record_state(self._meet[1], self._meet[0], self.message)
+                self.queue.clear()
+                self.queue_back.clear()
+                return False
+            if not self.queue or not self.queue_back:
+                self.message = "No hay solución"
+                self._record_state(-1, -1, self.message)
+                return False
+            self.forward = len(self.queue) <= len(self.queue_back)
+            self._layer_left = len(self.queue) if self.forward else len(self.queue_back)
+
+        if self.forward:
+            queue, adjacency = self.queue, self.adjacency
+            own_dist, other_dist, own_parent = self.dist, self.dist_back, self.parent
+        else:
+            queue, adjacency = self.queue_back, self.reverse_adjacency
+            own_dist, other_dist, own_parent = self.dist_back, self.dist, self.parent_back
+
+        current = queue.popleft()
+        self._layer_left -= 1
+        self.expanded += 1
+        self.history.remove_frontier(current)
+        self._record_state(current, own_parent[current])
+        if other_dist[current] >= 0:
+            self._offer(own_dist[current] + other_dist[current], current, current)
+
+        depth = own_dist[current] + 1
+        targets = adjacency.targets
+        for k in range(adjacency.offsets[current], adjacency.offsets[current + 1]):
+            neighbor_cell = targets[k]
+            if own_dist[neighbor_cell] < 0:
+                own_dist[neighbor_cell] = depth
+                own_parent[neighbor_cell] = current
+                queue.append(neighbor_cell)
+                self.history.add_frontier(neighbor_cell)
+                if not self.visited[neighbor_cell]:
+                    self.visited[neighbor_cell] = 1
+                    self.history.add_visited(neighbor_cell)
+            if other_dist[neighbor_cell] >= 0:
+                if self.forward:
+                    self._offer(depth + other_dist[neighbor_cell], current, neighbor_cell)
+                else:
+                    self._offer(depth + other_dist[neighbor_cell], neighbor_cell, current)
+
+        return True
+
+    def _step_adjacency(self):
+        return self.adjacency if self.forward else self.reverse_adjacency
+
+    def _offer(self, length, forward_cell, backward_cell):
+        if self._best < 0 or length < self._best:
+            self._best = length
+            self._meet = (forward_cell, backward_cell)
+
+
+class AStarSolver(Solver):
+    # Cada movimiento cambia la fila o la columna en a lo mas max_jump, asi que
+    # ceil(|dr| / J) + ceil(|dc| / J) nunca sobreestima (y es consistente).
+    # Con weight > 1 se obtiene A* ponderado: mas rapido pero no optimo.
+    def __init__(self, maze, weight=1.0):
+        super().__init__(maze)
+        self.weight = weight
+        self._initialize_search()
+
+    @staticmethod
+    def solve(maze, weight=1.0):
+        adjacency = maze.adjacency()
+        offsets, targets = adjacency.offsets, adjacency.targets
+        size = len(adjacency)
+        n = maze.n
+        jump = max(1, maze.max_jump())
+        goal_r, goal_c = maze.goal_pos
+        start = maze.cell_id(maze.start_pos)
+        goal = maze.cell_id(maze.goal_pos)
+        workspace = SearchWorkspace.current()
+        touched = array('i', (start,))
+        g = workspace.ints("dist", size, touched)
+        closed = workspace.marks("visited", size, touched)
+        parent = workspace.ints("parent", size)
+        g[start] = 0
+        parent[start] = -1
+        heap = [(0, 0, start)]
+        push, pop = heapq.heappush, heapq.heappop
+
+        while heap:
+            _, depth, cell = pop(heap)
+            depth = -depth
+            if closed[cell] or depth != g[cell]:
+                continue
+            if cell == goal:
+                return _unwind(maze, parent, cell)
+            closed[cell] = 1
+
+            depth += 1
+            for k in range(offsets[cell], offsets[cell + 1]):
+                nxt = targets[k]
+                if closed[nxt] or 0 <= g[nxt] <= depth:
+                    continue
+                if g[nxt] < 0:
+                    touched.append(nxt)
+                g[nxt] = depth
+                parent[nxt] = cell
+                r, c = divmod(nxt, n)
+                h = -(-abs(r - goal_r) // jump) - (-abs(c - goal_c) // jump)
+                push(heap, (depth + weight * h, -depth, nxt))
+        return None, None
+
+    def heuristic(self, cell):
+        r, c = self.maze.cell_pos(cell)
+        goal_r, goal_c = self.maze.goal_pos
+        return math.ceil(abs(r - goal_r) / self._jump) + math.ceil(abs(c - goal_c) / self._jump)
+
+    def _initialize_search(self):
+        start_cell = self.maze.cell_id(self.maze.start_pos)
+        self._jump = max(1, self.maze.max_jump())
+        self.g = array('i', [-1]) * len(self.adjacency)
+        self.g[start_cell] = 0
+        self.heap = [(self.weight * self.heuristic(start_cell), 0, start_cell)]
+        self.history.add_frontier(start_cell)
+        self._record_state(-1)
+
+    def _drop_frontier(self):
+        for _, _, cell in self.heap:
+            self.history.remove_frontier(cell)
+        self.heap.clear()
+
+    def step(self):
+        while self.heap:
+            _, depth, current = heapq.heappop(self.heap)
+            self.history.remove_frontier(current)
+            if not self.visited[current] and -depth == self.g[current]:
+                break
+        else:
+            if not self.solution_path:
+                self.message = "No hay solución"
+                self._record_state(-1, -1, self.message)
+            return False
+
+        self.visited[current] = 1
+        self.expanded += 1
+        self.history.add_visited(current)
+        parent = self.parent[current]
+
+        if current == self.goal_cell:
+            self._found(current)
+            self._record_state(current, parent, self.message)
+            self.heap.clear()
+            return False
+
+        self._record_state(current, parent)
+
+        depth = self.g[current] + 1
+        targets = self.adjacency.targets
+        for k in range(self.adjacency.offsets[current], self.adjacency.offsets[current + 1]):
+            neighbor_cell = targets[k]
+            if self.visited[neighbor_cell] or 0 <= self.g[neighbor_cell] <= depth:
+                continue
+            self.g[neighbor_cell] = depth
+            self.parent[neighbor_cell] = current
+            priority = depth + self.weight * self.heuristic(neighbor_cell)
+            heapq.heappush(self.heap, (priority, -depth, neighbor_cell))
+            self.history.add_frontier(neighbor_cell)
+
+        return True
+
+
+class IDDFSSolver(Solver):
+    # Profundizacion iterativa: DFS acotado por un umbral que sube, en cada
+    # iteracion, al menor valor que quedo fuera en la anterior; asi el primer
+    # camino que llega a la meta es el mas corto. La frontera es el camino en
+    # curso (la pila guarda cada celda con el proximo vecino a probar).
+    # best guarda la menor profundidad vista de cada celda, entre iteraciones,
+    # y seen la iteracion en que se expandio a esa profundidad: una celda se
+    # vuelve a expandir solo si se llega mas cerca del inicio, y a igual
+    # profundidad una vez por iteracion. Sin eso, cada cambio de profundidad
+    # re-expande subarboles enteros.
+    def __init__(self, maze):
+        super().__init__(maze)
+        self._initialize_search()
+
+    @staticmethod
+    def solve(maze):
+        return _deepening(maze, informed=False)
+
+    def heuristic(self, cell):
+        return 0
+
+    def precheck(self):
+        # Cada iteracion ya recorre la zona alcanzable, asi que aqui las
+        # componentes (Maze.components) salen baratas y evitan agotar todas
+        # las iteraciones en un tablero sin solucion.
+        self.maze.components()
+        return super().precheck()
+
+    def _initialize_search(self):
+        size = len(self.adjacency)
+        start_cell = self.maze.cell_id(self.maze.start_pos)
+        self._jump = max(1, self.maze.max_jump())
+        self.threshold = self.heuristic(start_cell)
+        self.iteration = 0
+        self.best = array('i', [-1]) * size
+        self.seen = array('i', [0]) * size
+        self.best[start_cell] = 0
+        self._start_iteration()
+
+    def _start_iteration(self):
+        start_cell = self.maze.cell_id(self.maze.start_pos)
+        self.iteration += 1
+        self.seen[start_cell] = self.iteration
+        self.path = [start_cell]
+        self.edges = [self.adjacency.offsets[start_cell]]
+        self._pruned = -1
+        self.expanded += 1
+        if not self.visited[start_cell]:
+            self.visited[start_cell] = 1
+            self.history.add_visited(start_cell)
+        self.history.add_frontier(start_cell)
+        self._record_state(-1, -1, f"Iteración {self.iteration}: umbral {self.threshold}")
+
+    def _drop_frontier(self):
+        for cell in self.path:
+            self.history.remove_frontier(cell)
+        self.path.clear()
+        self.edges.clear()
+        self._pruned = -1
+
+    def step(self):
+        offsets, targets = self.adjacency.offsets, self.adjacency.targets
+        best, seen = self.best, self.seen
+        while self.path:
+            current = self.path[-1]
+            if current == self.goal_cell:
+                self._found(current)
+                self._record_state(current, self.parent[current], self.message)
+                return False
+            k = self.edges[-1]
+            if k == offsets[current + 1]:
+                self.path.pop()
+                self.edges.pop()
+                self.history.remove_frontier(current)
+                continue
+            self.edges[-1] = k + 1
+            neighbor_cell = targets[k]
+            depth = len(self.path)
+            known = best[neighbor_cell]
+            if known >= 0 and (depth > known or (depth == known and seen[neighbor_cell] == self.iteration)):
+                continue
+            f = depth + self.heuristic(neighbor_cell)
+            if f > self.threshold:
+                if self._pruned < 0 or f < self._pruned:
+                    self._pruned = f
+                continue
+            best[neighbor_cell] = depth
+            seen[neighbor_cell] = self.iteration
+            self.parent[neighbor_cell] = current
+            self.path.append(neighbor_cell)
+            self.edges.append(offsets[neighbor_cell])
+            self.expanded += 1
+            if not self.visited[neighbor_cell]:
+                self.visited[neighbor_cell] = 1
+                self.history.add_visited(neighbor_cell)
+            self.history.add_frontier(neighbor_cell)
+            self._record_state(neighbor_cell, current)
+            return True
+
+        if self._pruned < 0:
+            self.message = "No hay solución"
+            self._record_state(-1, -1, self.message)
+            return False
+        self.threshold = self._pruned
+        self._start_iteration()
+        return True
+
+
+class IDAStarSolver(IDDFSSolver):
+    # IDA*: la misma profundizacion, acotando profundidad + heuristica con la
+    # cota admisible (y consistente) de A*.
+    heuristic = AStarSolver.heuristic
+
+    @staticmethod
+    def solve(maze):
+        return _deepening(maze, informed=True)
+
+
+def _deepening(maze, informed):
+    # Version sin historial de IDDFSSolver / IDAStarSolver, con las mismas
+    # reglas: el camino es la pila y best / seen vienen del workspace. Como
+    # cada iteracion recorre lo alcanzable dentro del umbral, se descartan
+    # antes las metas inalcanzables (Maze.reachable).
+    if not maze.reachable():
+        return None, None
+    adjacency = maze.adjacency()
+    offsets, targets = adjacency.offsets, adjacency.targets
+    size = len(adjacency)
+    n = maze.n
+    jump = max(1, maze.max_jump())
+    goal_r, goal_c = maze.goal_pos
+    start = maze.cell_id(maze.start_pos)
+    goal = maze.cell_id(maze.goal_pos)
+    if start == goal:
+        return 0, [maze.start_pos]
+    start_r, start_c = maze.start_pos
+    threshold = -(-abs(start_r - goal_r) // jump) - (-abs(start_c - goal_c) // jump) if informed else 0
+
+    workspace = SearchWorkspace.current()
+    touched = array('i', (start,))
+    best = workspace.ints("dist", size, touched)
+    seen = workspace.ints("seen", size, touched)
+    best[start] = 0
+    iteration = 0
+    while True:
+        iteration += 1
+        seen[start] = iteration
+        path = array('i', (start,))
+        edges = array('i', (offsets[start],))
+        pruned = -1
+        while path:
+            cell = path[-1]
+            k = edges[-1]
+            if k == offsets[cell + 1]:
+                path.pop()
+                edges.pop()
+                continue
+            edges[-1] = k + 1
+            nxt = targets[k]
+            depth = len(path)
+            known = best[nxt]
+            if known >= 0 and (depth > known or (depth == known and seen[nxt] == iteration)):
+                continue
+            if informed:
+                r, c = divmod(nxt, n)
+                f = depth - (-abs(r - goal_r) // jump) - (-abs(c - goal_c) // jump)
+            else:
+                f = depth
+            if f > threshold:
+                if pruned < 0 or f < pruned:
+                    pruned = f
+                continue
+            path.append(nxt)
+            if nxt == goal:
+                return len(path) - 1, [maze.cell_pos(cell) for cell in path]
+            if known < 0:
+                touched.append(nxt)
+            best[nxt] = depth
+            seen[nxt] = iteration
+            edges.append(offsets[nxt])
+        if pruned < 0:
+            return None, None
+        threshold = pruned
+
+
+def _bfs_numpy(maze):
+    # BFS por niveles: cada capa de la frontera se expande de una vez
+    # desplazando por el valor de salto en las 4 direcciones. Las capas chicas
+    # se expanden en Python para no pagar el costo fijo de NumPy por capa.
+    # visited/parent/jumps comparten memoria entre las dos versiones.
+    m, n = maze.m, maze.n
+    size = m * n
+    jumps = maze.cells
+    visited = bytearray(size)
+    parent = SearchWorkspace.current().ints("parent", size)
+    jumps_np = np.frombuffer(jumps, dtype=_typecode(jumps)).astype(np.int64)
+    visited_np = np.frombuffer(visited, dtype=np.bool_)
+    parent_np = np.frombuffer(parent, dtype=np.int32, count=size)
+
+    start = maze.cell_id(maze.start_pos)
+    goal = maze.cell_id(maze.goal_pos)
+    visited[start] = 1
+    parent[start] = -1
+    frontier = [start]
+
+    while len(frontier) and not visited[goal]:
+        if len(frontier) < NUMPY_BFS_MIN_LAYER:
+            if not isinstance(frontier, list):
+                frontier = frontier.tolist()
+            layer = []
+            for cell in frontier:
+                jump = jumps[cell]
+                if not jump:
+                    continue
+                r, c = divmod(cell, n)
+                for nr, nc in ((r - jump, c), (r + jump, c), (r, c - jump), (r, c + jump)):
+                    if 0 <= nr < m and 0 <= nc < n:
+                        nxt = nr * n + nc
+                        if not visited[nxt]:
+                            visited[nxt] = 1
+                            parent[nxt] = cell
+                            layer.append(nxt)
+            frontier = layer
+            continue
+
+        cells = np.asarray(frontier, dtype=np.int64)
+        rows, cols = np.divmod(cells, n)
+        jump = jumps_np[cells]
+        cand_r = np.stack((rows - jump, rows + jump, rows, rows), axis=1).ravel()
+        cand_c = np.stack((cols, cols, cols - jump, cols + jump), axis=1).ravel()
+        sources = np.repeat(cells, 4)
+        ok = (np.repeat(jump, 4) != 0) & (cand_r >= 0) & (cand_r < m) & (cand_c >= 0) & (cand_c < n)
+        cand = cand_r[ok] * n + cand_c[ok]
+        sources = sources[ok]
+        fresh = ~visited_np[cand]
+        cand = cand[fresh]
+        sources = sources[fresh]
+
+        # Igual que la cola de UCSSolver: gana el primer nodo de la capa que
+        # descubre a cada vecino, y la capa siguiente conserva ese orden.
+        cand, first = np.unique(cand, return_index=True)
+        order = np.argsort(first, kind="stable")
+        cand = cand[order]
+        parent_np[cand] = sources[first[order]]
+        visited_np[cand] = True
+        frontier = cand
+
+    if not visited[goal]:
+        return None, None
+    return _unwind(maze, parent, goal)
+
+
+def _splice(parent, parent_back, meet, goal):
+    # Encadena la mitad hacia la meta sobre parent para poder reconstruir el
+    # camino completo desde la meta con _unwind.
+    forward_cell, backward_cell = meet
+    if forward_cell != backward_cell:
+        parent[backward_cell] = forward_cell
+    cell = backward_cell
+    while cell != goal:
+        nxt = parent_back[cell]
+        parent[nxt] = cell
+        cell = nxt
+
+
+def _unwind(maze, parent, cell):
+    path = []
+    while cell >= 0:
+        path.append(maze.cell_pos(cell))
+        cell = parent[cell]
+    path.reverse()
+    return len(path) - 1, path
+
+
+SOLVERS = {
+    "DFS": DFSSolver,
+    "UCS": UCSSolver,
+    "BIDI": BidirectionalSolver,
+    "ASTAR": AStarSolver,
+    "IDDFS": IDDFSSolver,
+    "IDASTAR": IDAStarSolver,
+}
+
+ALGORITHM_LABELS = {
+    "DFS": "DFS",
+    "UCS": "UCS (BFS)",
+    "BIDI": "BFS Bidir.",
+    "ASTAR": "A*",
+    "IDDFS": "IDDFS",
+    "IDASTAR": "IDA*",
+}
+
+
+def solve(maze, algo="UCS"):
+    # Las componentes cuestan mas que una busqueda suelta; solo se usan si el
+    # laberinto ya las tiene calculadas.
+    if maze._components is not None and not maze.reachable():
+        return None, None
+    return SOLVERS[algo].solve(maze)
+
+
+def _path_cells(maze, path):
+    return array('i', (r * maze.n + c for r, c in path)) if path else None
+
+
+class ResultStore:
+    # Resultados en disco (sqlite) para reutilizarlos entre ejecuciones. Cada
+    # fila lleva un contador de uso; pasado max_entries se borran las usadas
+    # hace mas tiempo. Las escrituras se confirman de a RESULT_STORE_BATCH.
+    def __init__(self, filename, max_entries=RESULT_STORE_MAX_ENTRIES):
+        try:
+            import sqlite3
+        except ImportError:
+            raise RuntimeError("sqlite3 no esta disponible en esta instalacion de Python")
+        self.max_entries = max_entries
+        self._db = sqlite3.connect(filename)
+        self._db.execute("CREATE TABLE IF NOT EXISTS results (key TEXT, algo TEXT, moves INTEGER, "
+                         "path BLOB, used INTEGER, PRIMARY KEY (key, algo))")
+        self._db.execute("CREATE INDEX IF NOT EXISTS results_used ON results (used)")
+        self._clock = self._db.execute("SELECT MAX(used) FROM results").fetchone()[0] or 0
+        self._pending = 0
+
+    def get(self, key, algo):
+        row = self._db.execute("SELECT moves, path FROM results WHERE key = ? AND algo = ?", (key, algo)).fetchone()
+        if row is None:
+            return None
+        self._clock += 1
+        self._db.execute("UPDATE results SET used = ? WHERE key = ? AND algo = ?", (self._clock, key, algo))
+        self._written()
+        moves, blob = row
+        return moves, array('i', blob) if blob is not None else None
+
+    def put(self, key, algo, moves, cells):
+        self._clock += 1
+        self._db.execute("INSERT OR REPLACE INTO results VALUES (?, ?, ?, ?, ?)",
+                         (key, algo, moves, cells.tobytes() if cells is not None else None, self._clock))
+        self._written()
+
+    def _written(self):
+        self._pending += 1
+        if self._pending >= RESULT_STORE_BATCH:
+            self.flush()
+
+    def flush(self):
+        count = self._db.execute("SELECT COUNT(*) FROM results").fetchone()[0]
+        if count > self.max_entries:
+            self._db.execute("DELETE FROM results WHERE rowid IN "
+                             "(SELECT rowid FROM results ORDER BY used LIMIT ?)", (count - self.max_entries,))
+        self._db.commit()
+        self._pending = 0
+
+    def close(self):
+        self.flush()
+        self._db.close()
+
+
+class ResultCache:
+    # Resultados de solve() por contenido: huella del laberinto (m, n y la
+    # grilla) mas inicio y meta, asi los tableros repetidos se resuelven una
+    # sola vez. LRU en memoria acotado por entradas y por celdas de camino,
+    # con un ResultStore opcional detras. Los caminos se guardan como ids.
+    def __init__(self, max_entries=RESULT_CACHE_MAX_ENTRIES, max_cells=RESULT_CACHE_MAX_CELLS, store=None):
+        self.max_entries = max_entries
+        self.max_cells = max_cells
+        self.store = store
+        self.hits = 0
+        self.misses = 0
+        self._results = OrderedDict()
+        self._cells = 0
+
+    def __len__(self):
+        return len(self._results)
+
+    @staticmethod
+    def key(maze):
+        (start_r, start_c), (goal_r, goal_c) = maze.start_pos, maze.goal_pos
+        return f"{maze.fingerprint()}:{start_r},{start_c}:{goal_r},{goal_c}"
+
+    def open_store(self, filename, max_entries=RESULT_STORE_MAX_ENTRIES):
+        self.close()
+        self.store = ResultStore(filename, max_entries)
+
+    def close(self):
+        if self.store is not None:
+            self.store.close()
+            self.store = None
+
+    def clear(self):
+        self._results.clear()
+        self._cells = 0
+
+    def get(self, maze, algo):
+        entry = self._lookup(self.key(maze), algo)
+        if entry is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        moves, cells = entry
+        return moves, [maze.cell_pos(cell) for cell in cells] if cells is not None else None
+
+    def put(self, maze, algo, moves, path):
+        self.put_cells(maze, algo, moves, _path_cells(maze, path))
+
+    def put_cells(self, maze, algo, moves, cells):
+        key = self.key(maze)
+        self._remember(key, algo, moves, cells)
+        if self.store is not None:
+            self.store.put(key, algo, moves, cells)
+
+    def solve(self, maze, algo="UCS"):
+        result = self.get(maze, algo)
+        if result is None:
+            result = solve(maze, algo)
+            self.put(maze, algo, *result)
+        return result
+
+    def _lookup(self, key, algo):
+        entry = self._results.get((key, algo))
+        if entry is not None:
+            self._results.move_to_end((key, algo))
+        elif self.store is not None:
+            entry = self.store.get(key, algo)
+            if entry is not None:
+                self._remember(key, algo, *entry)
+        return entry
+
+    def _remember(self, key, algo, moves, cells):
+        old = self._results.pop((key, algo), None)
+        if old is not None:
+            self._cells -= len(old[1]) if old[1] is not None else 0
+        self._results[(key, algo)] = (moves, cells)
+        self._cells += len(cells) if cells is not None else 0
+        while len(self._results) > 1 and (len(self._results) > self.max_entries or self._cells > self.max_cells):
+            _, (_, evicted) = self._results.popitem(last=False)
+            self._cells -= len(evicted) if evicted is not None else 0
+
+
+RESULTS = ResultCache()
+
+
+def parse_input_file(filename):
+    return list(iter_mazes(filename))
+
+
+def iter_mazes(filename):
+    # Acepta tambien el formato binario de mazefile.py (se reconoce por su
+    # cabecera); mazefile importa este modulo, por eso se importa aqui.
+    from mazefile import MazeFile, is_binary
+    try:
+        if is_binary(filename):
+            with MazeFile(filename) as maze_file:
+                yield from maze_file
+            return
+        with open(filename, 'r') as f:
+            yield from read_mazes(f)
+    except FileNotFoundError:
+        print(f"Error: Archivo '{filename}' no encontrado.")
+        sys.exit(1)
+    except Exception as e:
+        print(f"Ocurrio un error leyendo el documento: {e}")
+
+
+def read_mazes(f, warn=print):
+    # Los avisos de lo que se salta van a warn (por defecto a la consola; el
+    # servidor los junta para devolverlos en la respuesta).
+    try:
+        while True:
+            line = f.readline()
+            if not line:
+                break
+            parts = list(map(int, line.split()))
+            if not parts or parts == [0]:
+                break
+            if len(parts) != 6:
+                warn(f"Warning: Cabecera invalida: {line.strip()}.")
+                continue
+
+            m, n, start_r, start_c, goal_r, goal_c = parts
+            if m <= 0 or n <= 0:
+                warn(f"Warning: Dimension invalida m={m}, n={n}. Saltando laberinto.")
+                continue
+
+            grid = array('q')
+            try:
+                for r in range(m):
+                    grid.extend(map(int, f.readline().split()))
+                    if len(grid) != (r + 1) * n:
+                        raise ValueError(f"Numero de columnas incorrectas. Se esperaban {n}, y se tienen {len(grid) - r * n}.")
+            except Exception as e:
+                warn(f"Error al leer el area de trabajo: {e}. Saltando laberinto.")
+                continue 
+
+            start_pos = (start_r, start_c)
+            goal_pos = (goal_r, goal_c)
+
+            if not (0 <= start_r < m and 0 <= start_c < n):
+                 warn(f"Warning: Posicion de inicio {start_pos} fuera de rango {m}x{n} grid. Saltando laberinto.")
+                 continue
+            if not (0 <= goal_r < m and 0 <= goal_c < n):
+                 warn(f"Warning: Posicion final {goal_pos} fuera de rango {m}x{n}. Saltando laberinto.")
+                 continue
+
+            yield Maze(m, n, start_pos, goal_pos, grid)
+
+    except Exception as e:
+        warn(f"Ocurrio un error leyendo el documento: {e}")
+
+
+def _solve_chunk(chunk, algos=("DFS", "UCS")):
+    results = []
+    for index, maze in chunk:
+        solved = []
+        for algo in algos:
+            moves, path = solve(maze, algo)
+            solved.append((moves, _path_cells(maze, path)))
+        results.append((index, solved))
+    return results
+
+
+def _plan_chunks(mazes, indices, workers, chunk_size=64):
+    # Del mas grande al mas chico para balancear la carga; los chicos se
+    # agrupan (hasta chunk_size laberintos o un presupuesto de celdas) para
+    # amortizar el envio entre procesos.
+    order = sorted(indices, key=lambda i: mazes[i].m * mazes[i].n, reverse=True)
+    total_cells = sum(mazes[i].m * mazes[i].n for i in order)
+    cell_budget = max(1, total_cells // (workers * 8))
+
+    chunks = []
+    chunk, chunk_cells = [], 0
+    for index in order:
+        chunk.append((index, mazes[index]))
+        chunk_cells += mazes[index].m * mazes[index].n
+        if len(chunk) >= chunk_size or chunk_cells >= cell_budget:
+            chunks.append(chunk)
+            chunk, chunk_cells = [], 0
+    if chunk:
+        chunks.append(chunk)
+    return chunks
+
+
+def solve_batch(mazes, workers=None, chunk_size=64, cache=None):
+    # Reparte los laberintos entre procesos en chunks (ver _plan_chunks).
+    # Entrega (indice, dfs, ucs) en el orden de entrada, a medida que van
+    # quedando listos. Con cache, los tableros ya conocidos o repetidos dentro
+    # del lote no se mandan a resolver.
+    workers = workers or os.cpu_count() or 1
+    keys = [cache.key(maze) for maze in mazes] if cache is not None else range(len(mazes))
+    moves_by_key = {}
+    pending = set()
+    todo = []
+    for index, maze in enumerate(mazes):
+        key = keys[index]
+        if key in moves_by_key or key in pending:
+            if cache is not None:
+                cache.hits += 2
+            continue
+        dfs = cache.get(maze, "DFS") if cache is not None else None
+        ucs = cache.get(maze, "UCS") if cache is not None else None
+        if dfs is not None and ucs is not None:
+            moves_by_key[key] = (dfs[0], ucs[0])
+        else:
+            pending.add(key)
+            todo.append(index)
+    chunks = _plan_chunks(mazes, todo, workers, chunk_size)
+
+    next_index = 0
+    while next_index < len(mazes) and keys[next_index] in moves_by_key:
+        yield (next_index,) + moves_by_key[keys[next_index]]
+        next_index += 1
+    if not chunks:
+        return
+    from concurrent.futures import ProcessPoolExecutor, as_completed
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = [pool.submit(_solve_chunk, chunk) for chunk in chunks]
+        for future in as_completed(futures):
+            for index, ((dfs_moves, dfs_cells), (ucs_moves, ucs_cells)) in future.result():
+                moves_by_key[keys[index]] = (dfs_moves, ucs_moves)
+                if cache is not None:
+                    cache.put_cells(mazes[index], "DFS", dfs_moves, dfs_cells)
+                    cache.put_cells(mazes[index], "UCS", ucs_moves, ucs_cells)
+            while next_index < len(mazes) and keys[next_index] in moves_by_key:
+                yield (next_index,) + moves_by_key[keys[next_index]]
+                next_index += 1
+
+
+def _print_result(i, maze, dfs_moves, ucs_moves):
+     print(f"\n--- Resolviendo laberinto {i+1} ({maze.m}x{maze.n}) ---")
+     if dfs_moves is not None:
+         print(f"DFS: Camino encontrado en {dfs_moves} movimientos.")
+     else:
+         print(f"DFS: No se encontro solución.")
+
+     print("UCS (BFS): ", end="")
+     if ucs_moves is not None:
+         print(f"{ucs_moves}") 
+     else:
+         print("No hay solución")
+
+
+def run_solvers_for_console_output(filename, workers=1, chunk_size=64, cache=RESULTS):
+     print("-" * 30)
+     print("Laberintos:")
+     print("-" * 30)
+     loaded = 0
+     hits = cache.hits if cache is not None else 0
+     if workers == 1:
+         solve_one = cache.solve if cache is not None else solve
+         for i, maze in enumerate(iter_mazes(filename)):
+             loaded += 1
+             _print_result(i, maze, solve_one(maze, "DFS")[0], solve_one(maze, "UCS")[0])
+     else:
+         mazes = parse_input_file(filename)
+         loaded = len(mazes)
+         for i, dfs_moves, ucs_moves in solve_batch(mazes, workers, chunk_size, cache):
+             _print_result(i, mazes[i], dfs_moves, ucs_moves)
+
+     if not loaded:
+         print("No se cargo laberinto.")
+         return
+     print("-" * 30)
+     if cache is not None and cache.hits > hits:
+         print(f"Resultados reutilizados de la caché: {cache.hits - hits}")
@@ -0,0 +1,28 @@
+import os
+
+from mazefile import check_round_trip, write_binary
+from solvers import parse_input_file, run_solvers_for_console_output
+
+INPUT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "input.txt")
+
+
+def test_round_trip():
+    ok, count = check_round_trip(INPUT)
+    assert ok
+    assert count > 0
+
+
+def test_binary_input(tmp_path, capsys):
+    # Un .lab se lee igual que el texto del que salio, tambien por consola.
+    binary = str(tmp_path / "input.lab")
+    write_binary(binary, parse_input_file(INPUT))
+    text_mazes = parse_input_file(INPUT)
+    binary_mazes = parse_input_file(binary)
+    assert [(m.m, m.n, m.start_pos, m.goal_pos, list(m.cells)) for m in binary_mazes] == \
+        [(m.m, m.n, m.start_pos, m.goal_pos, list(m.cells)) for m in text_mazes]
+    del binary_mazes
+
+    run_solvers_for_console_output(INPUT, cache=None)
+    from_text = capsys.readouterr().out
+    run_solvers_for_console_output(binary, cache=None)
+    assert capsys.readouterr().out == from_text
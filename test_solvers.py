@@ -0,0 +1,100 @@
+import io
+import random
+
+import pytest
+
+from solvers import DistanceFieldCache, IDAStarSolver, IDDFSSolver, Maze, ResultCache, UCSSolver, read_mazes
+
+
+def _random_maze(seed):
+    rng = random.Random(seed)
+    m, n = rng.randint(1, 9), rng.randint(1, 9)
+    grid = [[rng.choice([0, 1, 1, 1, 2, 2, 3, 4]) for _ in range(n)] for _ in range(m)]
+    return Maze(m, n, (rng.randrange(m), rng.randrange(n)), (rng.randrange(m), rng.randrange(n)), grid)
+
+
+def _check_path(maze, path, moves):
+    assert len(path) - 1 == moves
+    assert path[0] == maze.start_pos and path[-1] == maze.goal_pos
+    for a, b in zip(path, path[1:]):
+        assert maze.cell_id(b) in maze.successors(maze.cell_id(a))
+
+
+@pytest.mark.parametrize("cls", [IDDFSSolver, IDAStarSolver])
+def test_deepening_is_shortest(cls):
+    # Con el umbral minimo podado, la primera llegada a la meta es optima.
+    maze = Maze(4, 3, (0, 1), (3, 0), [[2, 1, 3], [1, 3, 3], [0, 0, 1], [1, 1, 1]])
+    assert cls.solve(maze)[0] == UCSSolver.solve(maze)[0] == 4
+    for seed in range(1500):
+        maze = _random_maze(seed)
+        expected = UCSSolver.solve(maze)[0]
+        moves, path = cls.solve(maze)
+        assert moves == expected, seed
+        if moves is not None:
+            _check_path(maze, path, moves)
+
+
+@pytest.mark.parametrize("cls", [IDDFSSolver, IDAStarSolver])
+def test_deepening_history_matches_solve(cls):
+    for seed in range(300):
+        maze = _random_maze(seed)
+        solver = cls(maze)
+        solver.run_all()
+        moves = len(solver.solution_path) - 1 if solver.solution_path else None
+        assert moves == cls.solve(maze)[0], seed
+        if moves is not None:
+            _check_path(maze, solver.solution_path, moves)
+
+
+def test_live_distance_field_matches_recompute():
+    # DynamicDistanceField repara el campo tras cada set_jump (o escritura en
+    # grid); tiene que coincidir con un BFS inverso desde cero.
+    for seed in range(1500):
+        rng = random.Random(f"edits:{seed}")
+        maze = _random_maze(seed)
+        goal_pos = (rng.randrange(maze.m), rng.randrange(maze.n))
+        field = maze.track_distance(goal_pos)
+        for _ in range(30):
+            pos = (rng.randrange(maze.m), rng.randrange(maze.n))
+            value = rng.choice([0, 1, 1, 2, 3, 4, 300])
+            if rng.random() < 0.5:
+                maze.set_jump(pos, value)
+            else:
+                maze.grid[pos[0]][pos[1]] = value
+            assert list(field.dist) == list(DistanceFieldCache.compute(maze, goal_pos)), seed
+
+            start_pos = (rng.randrange(maze.m), rng.randrange(maze.n))
+            moves = maze.distance(start_pos, goal_pos)
+            path = maze.path_from(start_pos, goal_pos)
+            if moves is None:
+                assert path is None
+            else:
+                assert path[0] == start_pos and path[-1] == goal_pos
+                assert len(path) - 1 == moves
+                for a, b in zip(path, path[1:]):
+                    assert maze.cell_id(b) in maze.successors(maze.cell_id(a))
+
+
+def test_fingerprint_ignores_cell_width():
+    # Ensanchar la grilla (set_jump con un salto grande) y volver al valor
+    # original no cambia la huella, asi la cache reconoce el tablero.
+    grid = [[2, 1, 0], [1, 1, 1]]
+    maze = Maze(2, 3, (0, 0), (0, 2), grid)
+    cache = ResultCache()
+    cache.solve(maze)
+    widened = Maze(2, 3, (0, 0), (0, 2), grid)
+    widened.set_jump((1, 0), 300)
+    widened.set_jump((1, 0), 1)
+    assert widened.cells.typecode != maze.cells.typecode
+    assert widened.fingerprint() == maze.fingerprint()
+    assert cache.get(widened, "UCS") is not None
+
+
+def test_read_mazes_reports_skipped_mazes(capsys):
+    text = "1 0\n2 2 0 0 1 1\n1 x\n1 0\n2 2 0 0 1 1\n1 1\n1 0\n0\n"
+    warnings = []
+    mazes = list(read_mazes(io.StringIO(text), warnings.append))
+    # La fila que sobra del laberinto invalido ("1 0") se lee como cabecera.
+    assert len(mazes) == 1 and len(warnings) == 3
+    assert "Cabecera invalida" in warnings[0] and "area de trabajo" in warnings[1]
+    assert capsys.readouterr().out == ""
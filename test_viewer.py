@@ -0,0 +1,129 @@
+import os
+import time
+import random
+
+import pytest
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+pygame = pytest.importorskip("pygame")
+
+import viewer
+from solvers import ALGORITHM_LABELS, SOLVERS, Maze, UCSSolver
+
+INPUT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "input.txt")
+
+
+def _scripted_viewer(monkeypatch, script):
+    # Maneja run_viewer con clics simulados: cada accion es el texto de un
+    # boton o "*N" para dejar pasar N cuadros. Al terminar el guion se cierra.
+    buttons = {}
+    init = viewer.Button.__init__
+
+    def record(self, x, y, w, h, text, *args, **kwargs):
+        init(self, x, y, w, h, text, *args, **kwargs)
+        buttons.setdefault(text, []).append(self)
+
+    state = {"pos": (0, 0), "i": 0, "wait": 0}
+    get = pygame.event.get
+
+    def events():
+        get()
+        if state["wait"] > 0:
+            state["wait"] -= 1
+            return []
+        if state["i"] >= len(script):
+            return [pygame.event.Event(pygame.QUIT)]
+        action = script[state["i"]]
+        state["i"] += 1
+        if action.startswith("*"):
+            state["wait"] = int(action[1:])
+            return []
+        center = buttons[action][-1].rect.center
+        if state["pos"] != center:
+            # Primero se mueve el mouse (hover) y en el cuadro siguiente se hace clic.
+            state["pos"] = center
+            state["i"] -= 1
+            return []
+        return [pygame.event.Event(pygame.MOUSEBUTTONDOWN, button=1, pos=center)]
+
+    monkeypatch.setattr(viewer.Button, "__init__", record)
+    monkeypatch.setattr(pygame.event, "get", events)
+    monkeypatch.setattr(pygame.mouse, "get_pos", lambda: state["pos"])
+    try:
+        viewer.run_viewer(INPUT, cache=None)
+    except SystemExit:
+        pass
+    return state["i"]
+
+
+def test_viewer_runs_every_algorithm(monkeypatch):
+    script = []
+    for label in ALGORITHM_LABELS.values():
+        script += [label, "Resolver", "Next", "Next", "Play", "*30", "Back", "Menu"]
+    assert _scripted_viewer(monkeypatch, script) == len(script)
+
+
+def _wait(runner):
+    deadline = time.monotonic() + 30
+    while not runner.done and time.monotonic() < deadline:
+        time.sleep(0.001)
+    assert runner.done
+
+
+def test_runner_rules_out_unreachable_goal():
+    # El runner calcula las componentes antes de buscar: sin solucion no se
+    # explora nada, y quedan en el Maze para la proxima vez.
+    grid = [[1] * 30 for _ in range(30)]
+    grid[29][29] = 0
+    grid[28][29] = grid[29][28] = 0
+    maze = Maze(30, 30, (0, 0), (29, 29), grid)
+    for _ in range(2):
+        runner = viewer.SolverRunner(UCSSolver, maze).start()
+        _wait(runner)
+        assert runner.complete
+        assert len(runner.solver.history) == 2
+        assert runner.solver.message == "No hay solución"
+        assert maze._components is not None
+
+
+def _random_maze(rng):
+    m, n = rng.randint(20, 120), rng.randint(20, 120)
+    grid = [[rng.choice([0, 1, 1, 2, 3]) for _ in range(n)] for _ in range(m)]
+    return Maze(m, n, (0, 0), (m - 1, n - 1), grid)
+
+
+def test_incremental_draw_matches_full_redraw():
+    # SolverView redibuja solo lo que cambio; el cuadro tiene que ser igual al
+    # de una vista nueva con la misma camara.
+    pygame.init()
+    try:
+        screen = pygame.display.set_mode((viewer.WIDTH, viewer.HEIGHT))
+        area = pygame.Rect(0, 0, viewer.WIDTH, viewer.HEIGHT - 110)
+        for seed in range(12):
+            rng = random.Random(seed)
+            maze = _random_maze(rng)
+            solver = SOLVERS[rng.choice(list(SOLVERS))](maze)
+            solver.run_all()
+            view = viewer.SolverView(maze)
+            for _ in range(15):
+                action = rng.random()
+                if action < 0.2:
+                    view.zoom(rng.choice([1.25, 0.8, 2, 0.5]), (rng.randrange(800), rng.randrange(480)))
+                elif action < 0.3:
+                    view.pan(rng.randint(-100, 100), rng.randint(-100, 100))
+                last = len(solver.history) - 1
+                if rng.random() < 0.3:
+                    solver.current_step_index = rng.randrange(last + 1)
+                else:
+                    solver.current_step_index = min(last, solver.current_step_index + 1)
+                view.draw(screen, solver, {}, "")
+                drawn = pygame.image.tostring(screen.subsurface(area), "RGB")
+
+                fresh = viewer.SolverView(maze)
+                fresh.scale, fresh.offset_x, fresh.offset_y = view.camera
+                other = pygame.Surface(screen.get_size())
+                fresh.draw(other, solver, {}, "")
+                assert drawn == pygame.image.tostring(other.subsurface(area), "RGB"), (seed, view.camera)
+    finally:
+        pygame.quit()
@@ -0,0 +1,693 @@
+import pygame
+import sys
+import time
+import threading
+import math 
+
+from solvers import SOLVERS, ALGORITHM_LABELS, RESULTS, parse_input_file, load_numpy
+
+WIDTH, HEIGHT = 800, 600
+WHITE = (255, 255, 255)
+BLACK = (0, 0, 0)
+GRAY = (100, 100, 100)
+DARK_GRAY = (40, 40, 40)
+LIGHT_GRAY = (200, 200, 200)
+GREEN = (0, 180, 0) 
+BLUE = (100, 100, 255) 
+PURPLE = (128, 0, 128) 
+ORANGE = (255, 165, 0) 
+CYAN = (0, 255, 255)   
+RED = (255, 0, 0)     
+BUTTON_COLOR = (70, 70, 150)
+BUTTON_HOVER_COLOR = (100, 100, 180)
+BUTTON_TEXT_COLOR = WHITE
+
+
+MENU_BUTTON_WIDTH = 150
+MENU_BUTTON_HEIGHT = 50
+SOLVER_BUTTON_WIDTH = 90
+SOLVER_BUTTON_HEIGHT = 40
+ALGO_BUTTONS_PER_ROW = 3
+CELL_SIZE = 40 
+GRID_MARGIN = 50
+LOD_CELL_SIZE = 8
+MAX_CELL_SIZE = 80
+ZOOM_STEP = 1.25
+PAN_STEP = 40
+
+
+PLAY_DELAY_MS = 150 
+PLAY_SPEEDS = (1, 10, 100, 1000, 10000)
+
+
+class SolverRunner:
+    # Arma el solver y lo avanza en un hilo aparte, llenando su historial,
+    # mientras la interfaz lo reproduce a su propio ritmo. Armarlo construye
+    # la adyacencia del laberinto (y BIDI el grafo inverso), que en tableros
+    # grandes tarda segundos: por eso tambien va en el hilo, y solver queda en
+    # None hasta que existe con su primer paso. El hilo solo escribe en el
+    # historial; el indice de reproduccion queda en manos de la interfaz.
+    # Antes de buscar calcula las componentes del laberinto (Tarjan, cortable
+    # con stop) para que precheck descarte en O(1) una meta inalcanzable;
+    # quedan guardadas en el Maze, asi que volver a resolverlo no las repite.
+    # Con unreachable (p. ej. por un resultado en cache) no se busca.
+    def __init__(self, solver_class, maze, instrumented=False, unreachable=False):
+        self.solver_class = solver_class
+        self.maze = maze
+        self.instrumented = instrumented
+        self.solver = None
+        self.unreachable = unreachable
+        self.done = False
+        self.complete = False
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    def start(self):
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._stop.set()
+        # Armar el solver no se puede cortar; si aun no existe no se espera al
+        # hilo: al terminar de armarlo ve la senal y sale sin buscar.
+        if self.solver is not None:
+            self._thread.join()
+
+    @property
+    def last_step(self):
+        return len(self.solver.history) - 1 if self.solver is not None else -1
+
+    def _run(self):
+        try:
+            if self.instrumented:
+                self.solver = self.solver_class.instrumented(self.maze)
+            else:
+                self.solver = self.solver_class(self.maze)
+            if self._stop.is_set():
+                return
+            if self.unreachable:
+                self.solver.give_up()
+                self.complete = True
+            elif self.maze.components(self._stop) is None:
+                return
+            elif self.solver.precheck():
+                while not self._stop.is_set():
+                    if not self.solver.step():
+                        self.complete = True
+                        break
+            else:
+                self.complete = True
+        finally:
+            self.done = True
+
+
+class Button:
+    __slots__ = ('rect', 'text', 'color', 'hover_color', 'text_color', 'font', 'is_hovered')
+
+    def __init__(self, x, y, width, height, text, color, hover_color, text_color, font):
+        self.rect = pygame.Rect(x, y, width, height)
+        self.text = text
+        self.color = color
+        self.hover_color = hover_color
+        self.text_color = text_color
+        self.font = font
+        self.is_hovered = False
+
+    def draw(self, screen):
+        current_color = self.hover_color if self.is_hovered else self.color
+        pygame.draw.rect(screen, current_color, self.rect, border_radius=5)
+        text_surf = self.font.render(self.text, True, self.text_color)
+        text_rect = text_surf.get_rect(center=self.rect.center)
+        screen.blit(text_surf, text_rect)
+
+    def check_hover(self, mouse_pos):
+        self.is_hovered = self.rect.collidepoint(mouse_pos)
+
+    def is_clicked(self, event):
+        return event.type == pygame.MOUSEBUTTONDOWN and event.button == 1 and self.is_hovered
+
+
+def draw_menu(screen, mazes, selected_maze_index, selected_algo, font, buttons):
+    screen.fill(DARK_GRAY)
+    title_font = pygame.font.SysFont(None, 60)
+    title_surf = title_font.render("Laberinto Saltarín", True, WHITE)
+    title_rect = title_surf.get_rect(center=(WIDTH // 2, 80))
+    screen.blit(title_surf, title_rect)
+
+    if mazes:
+        maze_text = f"Maze {selected_maze_index + 1} ({mazes[selected_maze_index].m}x{mazes[selected_maze_index].n})"
+        maze_font = pygame.font.SysFont(None, 40)
+        maze_surf = maze_font.render(maze_text, True, WHITE)
+        maze_rect = maze_surf.get_rect(center=(WIDTH // 2, 180))
+        screen.blit(maze_surf, maze_rect)
+        buttons["prev_maze"].draw(screen)
+        buttons["next_maze"].draw(screen)
+    else:
+        no_maze_font = pygame.font.SysFont(None, 40)
+        no_maze_surf = no_maze_font.render("No se cargo el laberinto", True, RED)
+        no_maze_rect = no_maze_surf.get_rect(center=(WIDTH // 2, 180))
+        screen.blit(no_maze_surf, no_maze_rect)
+
+
+    algo_label_font = pygame.font.SysFont(None, 35)
+    algo_label_surf = algo_label_font.render("Seleccione el Algoritmo a usar:", True, WHITE)
+    algo_label_rect = algo_label_surf.get_rect(center=(WIDTH // 2, 270))
+    screen.blit(algo_label_surf, algo_label_rect)
+
+    for algo in SOLVERS:
+        buttons[algo].draw(screen)
+
+    if selected_algo:
+        pygame.draw.rect(screen, LIGHT_GRAY, buttons[selected_algo].rect, 3)
+
+    if mazes and selected_algo:
+        buttons["start"].draw(screen)
+
+    
+    name = pygame.font.SysFont(None, 30)
+    name_surf = name.render("Matías Medina", True, WHITE)
+    name_rect = name_surf.get_rect(center=(WIDTH // 1.12, 580))
+    screen.blit(name_surf, name_rect)
+
+    pygame.display.flip()
+
+
+def calculate_grid_params(m, n):
+    max_grid_width = WIDTH - 2 * GRID_MARGIN
+    max_grid_height = HEIGHT - 2 * GRID_MARGIN - 100 
+
+    cell_size_w = max_grid_width // n
+    cell_size_h = max_grid_height // m
+    cell_size = min(cell_size_w, cell_size_h, 60) 
+
+    grid_width = n * cell_size
+    grid_height = m * cell_size
+
+    offset_x = (WIDTH - grid_width) // 2
+    offset_y = (HEIGHT - grid_height - 60) // 2 + 20 
+
+    return cell_size, offset_x, offset_y
+
+class SolverView:
+    # Vista de la grilla con camara (zoom y desplazamiento). Solo se dibujan
+    # las celdas visibles. Con celdas de LOD_CELL_SIZE px o mas se dibujan
+    # rectangulos con numeros: un fondo estatico por camara y encima solo las
+    # celdas que cambiaron desde el ultimo cuadro (segun el historial). Mas
+    # lejos se usa una imagen de un pixel por celda coloreada segun el estado,
+    # que se actualiza por celdas sucias y se escala a la ventana.
+    def __init__(self, maze):
+        self.maze = maze
+        self.area = pygame.Rect(0, 0, WIDTH, HEIGHT - 110)
+        self.ui_rect = pygame.Rect(0, HEIGHT - 110, WIDTH, 110)
+        self.status_font = pygame.font.SysFont(None, 30)
+        self.start_cell = maze.cell_id(maze.start_pos)
+        self.goal_cell = maze.cell_id(maze.goal_pos)
+        self._grid_font = None
+        self._grid_font_size = None
+        self._glyphs = {}
+        self._background = None
+        self._background_camera = None
+        self._image = None
+        self._image_solver = None
+        self._image_index = None
+        self._drawn_solver = None
+        self._drawn_index = None
+        self._drawn_camera = None
+        self._dragging = False
+        self._stats_font = None
+        self.fit()
+
+    @property
+    def camera(self):
+        return (self.scale, self.offset_x, self.offset_y)
+
+    @property
+    def detailed(self):
+        return self.scale >= LOD_CELL_SIZE
+
+    def fit(self):
+        m, n = self.maze.m, self.maze.n
+        cell_size, offset_x, offset_y = calculate_grid_params(m, n)
+        if cell_size >= LOD_CELL_SIZE:
+            self.scale, self.offset_x, self.offset_y = cell_size, offset_x, offset_y
+        else:
+            self.scale = min((WIDTH - 2 * GRID_MARGIN) / n, (HEIGHT - 2 * GRID_MARGIN - 100) / m)
+            self.offset_x = (WIDTH - n * self.scale) / 2
+            self.offset_y = (HEIGHT - m * self.scale - 60) / 2 + 20
+        self.min_scale = self.scale / 2
+
+    def zoom(self, factor, anchor=None):
+        anchor_x, anchor_y = anchor if anchor else self.area.center
+        scale = max(self.min_scale, min(MAX_CELL_SIZE, self.scale * factor))
+        if scale >= LOD_CELL_SIZE:
+            scale = round(scale)
+        self.offset_x = anchor_x - (anchor_x - self.offset_x) * scale / self.scale
+        self.offset_y = anchor_y - (anchor_y - self.offset_y) * scale / self.scale
+        self.scale = scale
+        self._snap()
+
+    def pan(self, dx, dy):
+        self.offset_x += dx
+        self.offset_y += dy
+        self._snap()
+
+    def _snap(self):
+        if self.detailed:
+            self.offset_x = round(self.offset_x)
+            self.offset_y = round(self.offset_y)
+
+    def handle_event(self, event):
+        if event.type == pygame.MOUSEWHEEL:
+            self.zoom(ZOOM_STEP if event.y > 0 else 1 / ZOOM_STEP, pygame.mouse.get_pos())
+        elif event.type == pygame.MOUSEBUTTONDOWN and event.button == 1 and self.area.collidepoint(event.pos):
+            self._dragging = True
+        elif event.type == pygame.MOUSEBUTTONUP and event.button == 1:
+            self._dragging = False
+        elif event.type == pygame.MOUSEMOTION and self._dragging:
+            self.pan(*event.rel)
+        elif event.type == pygame.KEYDOWN:
+            if event.key == pygame.K_LEFT:
+                self.pan(PAN_STEP, 0)
+            elif event.key == pygame.K_RIGHT:
+                self.pan(-PAN_STEP, 0)
+            elif event.key == pygame.K_UP:
+                self.pan(0, PAN_STEP)
+            elif event.key == pygame.K_DOWN:
+                self.pan(0, -PAN_STEP)
+            elif event.key in (pygame.K_PLUS, pygame.K_EQUALS, pygame.K_KP_PLUS):
+                self.zoom(ZOOM_STEP)
+            elif event.key in (pygame.K_MINUS, pygame.K_KP_MINUS):
+                self.zoom(1 / ZOOM_STEP)
+            elif event.key in (pygame.K_0, pygame.K_HOME):
+                self.fit()
+
+    def visible_range(self):
+        s = self.scale
+        c0 = max(0, int((self.area.left - self.offset_x) // s))
+        c1 = min(self.maze.n, int(math.ceil((self.area.right - self.offset_x) / s)))
+        r0 = max(0, int((self.area.top - self.offset_y) // s))
+        r1 = min(self.maze.m, int(math.ceil((self.area.bottom - self.offset_y) / s)))
+        return r0, max(r0, r1), c0, max(c0, c1)
+
+    def cell_rect(self, cell):
+        r, c = self.maze.cell_pos(cell)
+        return pygame.Rect(self.offset_x + c * self.scale, self.offset_y + r * self.scale,
+                           self.scale, self.scale)
+
+    def glyph(self, value, text_color):
+        key = (value, text_color)
+        surf = self._glyphs.get(key)
+        if surf is None:
+            surf = self._glyphs[key] = self._grid_font.render(str(value), True, text_color)
+        return surf
+
+    def cell_colors(self, cell, visited, frontier, current, final_cells):
+        cell_color = GRAY
+        text_color = BLACK
+
+        if cell == self.start_cell:
+            cell_color = BLUE
+            text_color = WHITE
+        elif cell == self.goal_cell:
+            cell_color = GREEN
+            text_color = WHITE
+
+        if cell in visited:
+             cell_color = CYAN
+             text_color = BLACK
+        if cell in frontier:
+             cell_color = ORANGE
+             text_color = BLACK
+        if cell == current:
+             cell_color = RED
+             text_color = WHITE
+        if cell in final_cells:
+             cell_color = PURPLE
+             text_color = WHITE
+             if cell == self.start_cell: cell_color = (100, 0, 100) 
+             if cell == self.goal_cell: cell_color = (0, 100, 0)   
+        return cell_color, text_color
+
+    def draw_cell(self, surface, cell, cell_color, text_color):
+        rect = self.cell_rect(cell)
+        pygame.draw.rect(surface, cell_color, rect)
+        pygame.draw.rect(surface, LIGHT_GRAY, rect, 1)
+        num_surf = self.glyph(self.maze.cells[cell], text_color)
+        surface.blit(num_surf, num_surf.get_rect(center=rect.center))
+        return rect
+
+    def draw(self, screen, solver, buttons, status_message):
+        draw_start = time.perf_counter()
+        history = solver.history if solver else None
+        index = solver.current_step_index if solver else -1
+        if history:
+            history.seek(index)
+            visited, frontier = history.visited_cells, history.frontier_cells
+            current, final_path = history.node(index), history.final_path(index)
+            message = history.message(index)
+        else:
+            visited, frontier, current, final_path, message = (), (), -1, None, ""
+        final_cells = {self.maze.cell_id(pos) for pos in final_path} if final_path else ()
+        status = (visited, frontier, current, final_cells)
+
+        new_solver = solver is not self._drawn_solver or self._drawn_index is None
+        full = new_solver or self.camera != self._drawn_camera
+        dirty = () if new_solver or index == self._drawn_index else history.changed_cells(self._drawn_index, index)
+
+        screen.set_clip(self.area)
+        if self.detailed:
+            rects = self._draw_cells(screen, status, dirty, full)
+        else:
+            rects = self._draw_image(screen, status, solver, index, full)
+        screen.set_clip(None)
+        self._drawn_solver = solver
+        self._drawn_index = index
+        self._drawn_camera = self.camera
+        stats = solver.stats if solver else None
+        if stats is not None:
+            rects.append(self._draw_stats(screen, stats))
+
+        screen.fill(DARK_GRAY, self.ui_rect)
+        for button in buttons.values():
+            button.draw(screen)
+
+        message_to_show = message if message else status_message
+        if final_path:
+             message_to_show = f"Solución encontrada en: {len(final_path)-1} movimientos" if final_path else "No hay solución"
+        elif message == "No hay solución":
+             message_to_show = "No hay solución"
+
+        status_surf = self.status_font.render(message_to_show, True, WHITE)
+        button_area_top_y = HEIGHT - 70
+        padding_above_buttons = 10 
+        status_rect = status_surf.get_rect(midbottom=(WIDTH // 2, button_area_top_y - padding_above_buttons))
+        screen.blit(status_surf, status_rect) 
+
+        if full:
+            pygame.display.flip()
+        else:
+            rects.append(self.ui_rect)
+            pygame.display.update(rects)
+        if stats is not None:
+            stats.render_s += time.perf_counter() - draw_start
+            stats.frames += 1
+
+    def _draw_stats(self, screen, stats):
+        # Recuadro opaco de tamano fijo: se repinta cada cuadro sobre la grilla.
+        if self._stats_font is None:
+            self._stats_font = pygame.font.SysFont(None, 20)
+        lines = stats.lines()
+        rect = pygame.Rect(8, 8, 240, 8 + 18 * len(lines))
+        screen.fill(DARK_GRAY, rect)
+        pygame.draw.rect(screen, LIGHT_GRAY, rect, 1)
+        for i, line in enumerate(lines):
+            screen.blit(self._stats_font.render(line, True, WHITE), (rect.x + 6, rect.y + 5 + 18 * i))
+        return rect
+
+    def _draw_cells(self, screen, status, dirty, full):
+        r0, r1, c0, c1 = self.visible_range()
+        n = self.maze.n
+        if full:
+            if self._background is None or self._background_camera != self.camera:
+                self._build_background(r0, r1, c0, c1)
+            screen.blit(self._background, self.area)
+            visited, frontier, current, final_cells = status
+            for r in range(r0, r1):
+                for cell in range(r * n + c0, r * n + c1):
+                    if cell in visited or cell in frontier or cell == current or cell in final_cells:
+                        self.draw_cell(screen, cell, *self.cell_colors(cell, *status))
+            return []
+
+        rects = []
+        for cell in dirty:
+            r, c = divmod(cell, n)
+            if r0 <= r < r1 and c0 <= c < c1:
+                rects.append(self.draw_cell(screen, cell, *self.cell_colors(cell, *status)).clip(self.area))
+        return rects
+
+    def _build_background(self, r0, r1, c0, c1):
+        # self.area empieza en (0, 0), asi que el fondo usa coordenadas de pantalla.
+        font_size = int(self.scale * 0.6)
+        if self._grid_font is None or self._grid_font_size != font_size:
+            self._grid_font = pygame.font.SysFont(None, font_size)
+            self._grid_font_size = font_size
+            self._glyphs = {}
+        self._background = pygame.Surface(self.area.size)
+        self._background.fill(DARK_GRAY)
+        self._background_camera = self.camera
+        n = self.maze.n
+        for r in range(r0, r1):
+            for cell in range(r * n + c0, r * n + c1):
+                self.draw_cell(self._background, cell, *self.cell_colors(cell, (), (), -1, ()))
+
+    def _draw_image(self, screen, status, solver, index, full):
+        # La imagen guarda el paso que refleja; puede quedar atrasada mientras
+        # se dibuja en modo detallado, y se pone al dia con el historial.
+        if self._image is None or solver is not self._image_solver:
+            self._build_image(status)
+        elif index != self._image_index:
+            dirty = solver.history.changed_cells(self._image_index, index)
+            if len(dirty) * 2 > self.maze.m * self.maze.n:
+                self._build_image(status)
+            else:
+                n = self.maze.n
+                for cell in dirty:
+                    r, c = divmod(cell, n)
+                    self._image.set_at((c, r), self.cell_colors(cell, *status)[0])
+        elif not full:
+            return []
+        self._image_solver = solver
+        self._image_index = index
+
+        screen.fill(DARK_GRAY, self.area)
+        r0, r1, c0, c1 = self.visible_range()
+        if r1 > r0 and c1 > c0:
+            s = self.scale
+            left, top = self.offset_x + c0 * s, self.offset_y + r0 * s
+            size = (max(1, round(self.offset_x + c1 * s - left)), max(1, round(self.offset_y + r1 * s - top)))
+            part = self._image.subsurface((c0, r0, c1 - c0, r1 - r0))
+            screen.blit(pygame.transform.scale(part, size), (round(left), round(top)))
+        return [self.area]
+
+    def _build_image(self, status):
+        visited, frontier, current, final_cells = status
+        m, n = self.maze.m, self.maze.n
+        self._image = pygame.Surface((n, m))
+        self._image.fill(GRAY)
+        self._paint((self.start_cell,), BLUE)
+        self._paint((self.goal_cell,), GREEN)
+        self._paint(visited, CYAN)
+        self._paint(frontier, ORANGE)
+        if current >= 0:
+            self._paint((current,), RED)
+        self._paint(final_cells, PURPLE)
+        if final_cells:
+            self._paint((self.start_cell,), (100, 0, 100))
+            self._paint((self.goal_cell,), (0, 100, 0))
+
+    def _paint(self, cells, color):
+        n = self.maze.n
+        np = load_numpy()
+        if np is not None and len(cells) > 256:
+            pixels = pygame.surfarray.pixels2d(self._image)
+            ids = np.fromiter(cells, dtype=np.int64, count=len(cells))
+            pixels[ids % n, ids // n] = self._image.map_rgb(color)
+            del pixels
+        else:
+            pixels = pygame.PixelArray(self._image)
+            for cell in cells:
+                r, c = divmod(cell, n)
+                pixels[c, r] = color
+            pixels.close()
+
+
+def draw_solver_view(screen, view, solver, buttons, status_message):
+    view.draw(screen, solver, buttons, status_message)
+
+
+def run_viewer(filename, show_stats=False, cache=RESULTS):
+    pygame.init()
+    screen = pygame.display.set_mode((WIDTH, HEIGHT))
+    pygame.display.set_caption("Laberinto Saltarín")
+    clock = pygame.time.Clock()
+    font = pygame.font.SysFont(None, 30) 
+
+    
+    mazes = parse_input_file(filename)
+    if not mazes:
+         print("No se encontraron laberintos válidos en el archivo entregado.")
+         pygame.quit()
+         sys.exit()
+
+    
+    game_state = "menu" 
+    selected_maze_index = 0
+    selected_algo = None 
+    current_maze = mazes[selected_maze_index]
+    solver = None
+    runner = None
+    result_saved = False
+    running = True
+    is_playing = False 
+    skip_to_end = False
+    speed_index = 0
+    last_step_time = 0
+    status_message = "" 
+    ready_message = ""
+
+    menu_buttons = {
+        "prev_maze": Button(WIDTH // 2 - 150 - 20, 160, 40, 40, "<", BUTTON_COLOR, BUTTON_HOVER_COLOR, BUTTON_TEXT_COLOR, font),
+        "next_maze": Button(WIDTH // 2 + 150 - 20, 160, 40, 40, ">", BUTTON_COLOR, BUTTON_HOVER_COLOR, BUTTON_TEXT_COLOR, font),
+    }
+    algo_rows = (len(SOLVERS) + ALGO_BUTTONS_PER_ROW - 1) // ALGO_BUTTONS_PER_ROW
+    for i, algo in enumerate(SOLVERS):
+        row, col = divmod(i, ALGO_BUTTONS_PER_ROW)
+        in_row = min(ALGO_BUTTONS_PER_ROW, len(SOLVERS) - row * ALGO_BUTTONS_PER_ROW)
+        row_x = WIDTH // 2 - (in_row * (MENU_BUTTON_WIDTH + 20) - 20) // 2
+        menu_buttons[algo] = Button(row_x + col * (MENU_BUTTON_WIDTH + 20), 300 + row * (MENU_BUTTON_HEIGHT + 10), MENU_BUTTON_WIDTH, MENU_BUTTON_HEIGHT, ALGORITHM_LABELS[algo], BUTTON_COLOR, BUTTON_HOVER_COLOR, BUTTON_TEXT_COLOR, font)
+    menu_buttons["start"] = Button(WIDTH // 2 - MENU_BUTTON_WIDTH // 2, 300 + algo_rows * (MENU_BUTTON_HEIGHT + 10) + 40, MENU_BUTTON_WIDTH, MENU_BUTTON_HEIGHT, "Resolver", BUTTON_COLOR, BUTTON_HOVER_COLOR, BUTTON_TEXT_COLOR, font)
+
+    solver_button_y = HEIGHT - 70
+    solver_buttons = {
+        "play": Button(GRID_MARGIN, solver_button_y, SOLVER_BUTTON_WIDTH, SOLVER_BUTTON_HEIGHT, "Play", BUTTON_COLOR, BUTTON_HOVER_COLOR, BUTTON_TEXT_COLOR, font),
+        "pause": Button(GRID_MARGIN + SOLVER_BUTTON_WIDTH + 10, solver_button_y, SOLVER_BUTTON_WIDTH, SOLVER_BUTTON_HEIGHT, "Pause", BUTTON_COLOR, BUTTON_HOVER_COLOR, BUTTON_TEXT_COLOR, font),
+        "back": Button(GRID_MARGIN + 2*(SOLVER_BUTTON_WIDTH + 10), solver_button_y, SOLVER_BUTTON_WIDTH, SOLVER_BUTTON_HEIGHT, "Back", BUTTON_COLOR, BUTTON_HOVER_COLOR, BUTTON_TEXT_COLOR, font),
+        "next": Button(GRID_MARGIN + 3*(SOLVER_BUTTON_WIDTH + 10), solver_button_y, SOLVER_BUTTON_WIDTH, SOLVER_BUTTON_HEIGHT, "Next", BUTTON_COLOR, BUTTON_HOVER_COLOR, BUTTON_TEXT_COLOR, font),
+        "end": Button(GRID_MARGIN + 4*(SOLVER_BUTTON_WIDTH + 10), solver_button_y, SOLVER_BUTTON_WIDTH, SOLVER_BUTTON_HEIGHT, "Fin", BUTTON_COLOR, BUTTON_HOVER_COLOR, BUTTON_TEXT_COLOR, font),
+        "speed": Button(GRID_MARGIN + 5*(SOLVER_BUTTON_WIDTH + 10), solver_button_y, SOLVER_BUTTON_WIDTH, SOLVER_BUTTON_HEIGHT, f"x{PLAY_SPEEDS[speed_index]}", BUTTON_COLOR, BUTTON_HOVER_COLOR, BUTTON_TEXT_COLOR, font),
+        "menu": Button(WIDTH - GRID_MARGIN - SOLVER_BUTTON_WIDTH, solver_button_y, SOLVER_BUTTON_WIDTH, SOLVER_BUTTON_HEIGHT, "Menu", BUTTON_COLOR, BUTTON_HOVER_COLOR, BUTTON_TEXT_COLOR, font),
+    }
+
+    view = None
+
+    while running:
+        mouse_pos = pygame.mouse.get_pos()
+        current_time = pygame.time.get_ticks()
+
+        for event in pygame.event.get():
+            if event.type == pygame.QUIT:
+                running = False
+                if runner:
+                    runner.stop()
+
+            if game_state == "menu":
+                buttons_to_check = menu_buttons
+                if not mazes or not selected_algo:
+                    buttons_to_check = {k: v for k, v in menu_buttons.items() if k != "start"}
+
+                for name, button in buttons_to_check.items():
+                    button.check_hover(mouse_pos)
+                    if button.is_clicked(event):
+                        if name == "prev_maze":
+                            selected_maze_index = (selected_maze_index - 1) % len(mazes)
+                            current_maze = mazes[selected_maze_index]
+                        elif name == "next_maze":
+                            selected_maze_index = (selected_maze_index + 1) % len(mazes)
+                            current_maze = mazes[selected_maze_index]
+                        elif name in SOLVERS:
+                            selected_algo = name
+                        elif name == "start":
+                            if selected_algo:
+                                cached = cache.get(current_maze, selected_algo) if cache is not None else None
+                                runner = SolverRunner(SOLVERS[selected_algo], current_maze, show_stats,
+                                                      cached is not None and cached[0] is None).start()
+                                solver = None
+                                result_saved = cached is not None or cache is None
+                                view = SolverView(current_maze)
+                                game_state = "solving"
+                                is_playing = False 
+                                skip_to_end = False
+                                status_message = "Calculando..."
+                                ready_message = "Presione Play o next para iniciar."
+                                if cached is not None:
+                                    known = f"{cached[0]} movimientos" if cached[0] is not None else "No hay solución"
+                                    ready_message = f"En caché: {known}. Presione Play o next."
+                        break 
+
+            elif game_state == "solving":
+                view.handle_event(event)
+                buttons_to_check = solver_buttons
+                for name, button in buttons_to_check.items():
+                    button.check_hover(mouse_pos)
+                    if button.is_clicked(event):
+                        if name == "play":
+                            is_playing = True
+                            skip_to_end = False
+                            status_message = "Ejecutando..."
+                            last_step_time = current_time 
+                        elif name == "pause":
+                            is_playing = False
+                            skip_to_end = False
+                            status_message = "Pausado, aprete Play or Next."
+                        elif name == "back":
+                            is_playing = False
+                            skip_to_end = False
+                            if solver:
+                                solver.prev_step()
+                            status_message = "Paso Anterior."
+                        elif name == "next":
+                            is_playing = False
+                            skip_to_end = False
+                            if solver:
+                                if solver.next_step():
+                                    status_message = "Paso Siguiente."
+                                elif not runner.done:
+                                    status_message = "Calculando..."
+                        elif name == "end":
+                            is_playing = False
+                            skip_to_end = True
+                            status_message = "Calculando..."
+                        elif name == "speed":
+                            speed_index = (speed_index + 1) % len(PLAY_SPEEDS)
+                            button.text = f"x{PLAY_SPEEDS[speed_index]}"
+
+                        elif name == "menu":
+                            game_state = "menu"
+                            runner.stop()
+                            runner = None
+                            solver = None 
+                            view = None
+                            selected_algo = None 
+                            is_playing = False
+                            skip_to_end = False
+                        break 
+
+        # El solver se arma en el hilo del runner; se toma cuando ya existe.
+        if runner and solver is None and runner.solver is not None:
+            solver = runner.solver
+            solver.current_step_index = 0
+            if status_message == "Calculando...":
+                status_message = ready_message
+
+        # El solver corre adelante en su hilo; aqui solo se mueve el indice de
+        # reproduccion. A x1 se mantiene el ritmo de un paso cada PLAY_DELAY_MS,
+        # a velocidades mayores se avanzan esa cantidad de pasos por cuadro.
+        if runner and runner.complete and not result_saved:
+            path = solver.solution_path
+            cache.put(current_maze, selected_algo, len(path) - 1 if path else None, path)
+            result_saved = True
+
+        if game_state == "solving" and solver and (is_playing or skip_to_end):
+            speed = PLAY_SPEEDS[speed_index]
+            if skip_to_end:
+                solver.current_step_index = max(solver.current_step_index, runner.last_step)
+            elif speed > 1:
+                solver.current_step_index = min(solver.current_step_index + speed, runner.last_step)
+            elif current_time - last_step_time > PLAY_DELAY_MS:
+                solver.next_step()
+                last_step_time = current_time
+            if runner.done and solver.current_step_index >= runner.last_step:
+                is_playing = False
+                skip_to_end = False
+                status_message = solver.message
+
+
+        if game_state == "menu":
+            draw_menu(screen, mazes, selected_maze_index, selected_algo, font, menu_buttons)
+        elif game_state == "solving":
+            draw_solver_view(screen, view, solver, solver_buttons, status_message)
+
+        clock.tick(60) 
+
+    pygame.quit()
+    sys.exit()